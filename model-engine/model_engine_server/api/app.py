@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytz
 from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from model_engine_server.api.batch_jobs_v1 import batch_job_router_v1
 from model_engine_server.api.dependencies import get_or_create_aioredis_pool
@@ -88,6 +88,7 @@ app = FastAPI(
     version="1.0.0",
     redoc_url="/api",
     middleware=[Middleware(CustomMiddleware)],
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(batch_job_router_v1)
@@ -118,7 +119,18 @@ def load_redis():
     get_or_create_aioredis_pool()
 
 
-def healthcheck() -> Response:
+@app.on_event("startup")
+def warm_openapi_schema():
+    # FastAPI memoizes the schema on first use; build it before serving so that the first
+    # /docs or /openapi.json request on each worker doesn't pay for it.
+    try:
+        app.openapi()
+    except Exception:
+        # A broken schema should only break /docs, as it did before warming, not worker startup.
+        logger.exception("Failed to build the OpenAPI schema at startup")
+
+
+async def healthcheck() -> Response:
     """Returns 200 if the app is healthy."""
     return Response(status_code=200)
 
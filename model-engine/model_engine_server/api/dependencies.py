@@ -2,10 +2,12 @@ import asyncio
 import os
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Optional
 
 import aioredis
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from model_engine_server.common.config import hmi_config
 from model_engine_server.common.dtos.model_endpoints import BrokerType
@@ -21,7 +23,11 @@ from model_engine_server.core.loggers import (
     logger_name,
     make_logger,
 )
-from model_engine_server.db.base import get_session_async, get_session_read_only_async
+from model_engine_server.db.base import (
+    get_session_async,
+    get_session_read_only_async,
+    is_db_session_refresh_needed,
+)
 from model_engine_server.domain.gateways import (
     CronJobGateway,
     DockerImageBatchJobGateway,
@@ -112,7 +118,9 @@ from model_engine_server.infra.repositories import (
     FakeDockerRepository,
     LiveTokenizerRepository,
     LLMFineTuneRepository,
+    ModelEndpointResponseCacheRepository,
     RedisModelEndpointCacheRepository,
+    RedisModelEndpointResponseCacheRepository,
     S3FileLLMFineTuneEventsRepository,
     S3FileLLMFineTuneRepository,
 )
@@ -165,6 +173,7 @@ class ExternalInterfaces:
     monitoring_metrics_gateway: MonitoringMetricsGateway
     tokenizer_repository: TokenizerRepository
     streaming_storage_gateway: StreamingStorageGateway
+    model_endpoint_response_cache_repository: ModelEndpointResponseCacheRepository
 
 
 def get_default_monitoring_metrics_gateway() -> MonitoringMetricsGateway:
@@ -189,23 +198,43 @@ def get_monitoring_metrics_gateway() -> MonitoringMetricsGateway:
         pass
 
 
-def _get_external_interfaces(
-    read_only: bool, session: Callable[[], AsyncSession]
-) -> ExternalInterfaces:
+@dataclass(frozen=True)
+class _StatelessInterfaces:
     """
-    Dependency that returns a ExternalInterfaces object. This allows repositories to share
-    sessions for the database and redis.
+    The gateways and repositories that hold neither a DB session nor a Redis client, and so can be
+    shared by every request in the process.
     """
+
+    inference_task_queue_gateway: TaskQueueGateway
+    infra_task_queue_gateway: TaskQueueGateway
+    monitoring_metrics_gateway: MonitoringMetricsGateway
+    queue_delegate: QueueEndpointResourceDelegate
+    async_model_endpoint_inference_gateway: LiveAsyncModelEndpointInferenceGateway
+    sync_model_endpoint_inference_gateway: LiveSyncModelEndpointInferenceGateway
+    streaming_model_endpoint_inference_gateway: LiveStreamingModelEndpointInferenceGateway
+    filesystem_gateway: FilesystemGateway
+    model_endpoints_schema_gateway: LiveModelEndpointsSchemaGateway
+    batch_job_orchestration_gateway: LiveBatchJobOrchestrationGateway
+    batch_job_progress_gateway: LiveBatchJobProgressGateway
+    model_primitive_gateway: ModelPrimitiveGateway
+    docker_image_batch_job_gateway: DockerImageBatchJobGateway
+    cron_job_gateway: CronJobGateway
+    llm_fine_tune_repository: LLMFineTuneRepository
+    llm_fine_tune_events_repository: LLMFineTuneEventsRepository
+    llm_batch_completions_service: LLMBatchCompletionsService
+    file_storage_gateway: FileStorageGateway
+    docker_repository: DockerRepository
+    tokenizer_repository: TokenizerRepository
+    streaming_storage_gateway: StreamingStorageGateway
+
+
+@lru_cache(maxsize=1)
+def _get_stateless_interfaces() -> _StatelessInterfaces:
     redis_task_queue_gateway = CeleryTaskQueueGateway(broker_type=BrokerType.REDIS)
     redis_24h_task_queue_gateway = CeleryTaskQueueGateway(broker_type=BrokerType.REDIS_24H)
     sqs_task_queue_gateway = CeleryTaskQueueGateway(broker_type=BrokerType.SQS)
     servicebus_task_queue_gateway = CeleryTaskQueueGateway(broker_type=BrokerType.SERVICEBUS)
     monitoring_metrics_gateway = get_monitoring_metrics_gateway()
-    model_endpoint_record_repo = DbModelEndpointRecordRepository(
-        monitoring_metrics_gateway=monitoring_metrics_gateway,
-        session=session,
-        read_only=read_only,
-    )
 
     queue_delegate: QueueEndpointResourceDelegate
     if CIRCLECI:
@@ -228,23 +257,6 @@ def _get_external_interfaces(
     else:
         inference_task_queue_gateway = sqs_task_queue_gateway
         infra_task_queue_gateway = sqs_task_queue_gateway
-    redis_client = aioredis.Redis(connection_pool=get_or_create_aioredis_pool())
-    inference_autoscaling_metrics_gateway = (
-        ASBInferenceAutoscalingMetricsGateway()
-        if infra_config().cloud_provider == "azure"
-        else RedisInferenceAutoscalingMetricsGateway(redis_client=redis_client)
-    )  # we can just reuse the existing redis client, we shouldn't get key collisions because of the prefix
-    resource_gateway = LiveEndpointResourceGateway(
-        queue_delegate=queue_delegate,
-        inference_autoscaling_metrics_gateway=inference_autoscaling_metrics_gateway,
-    )
-    model_endpoint_cache_repo = RedisModelEndpointCacheRepository(
-        redis_client=redis_client,
-    )
-    model_endpoint_infra_gateway = LiveModelEndpointInfraGateway(
-        resource_gateway=resource_gateway,
-        task_queue_gateway=infra_task_queue_gateway,
-    )
     async_model_endpoint_inference_gateway = LiveAsyncModelEndpointInferenceGateway(
         task_queue_gateway=inference_task_queue_gateway
     )
@@ -260,42 +272,11 @@ def _get_external_interfaces(
         if infra_config().cloud_provider == "azure"
         else S3FilesystemGateway()
     )
-    llm_artifact_gateway = (
-        ABSLLMArtifactGateway()
-        if infra_config().cloud_provider == "azure"
-        else S3LLMArtifactGateway()
-    )
     model_endpoints_schema_gateway = LiveModelEndpointsSchemaGateway(
         filesystem_gateway=filesystem_gateway
     )
-    model_endpoint_service = LiveModelEndpointService(
-        model_endpoint_record_repository=model_endpoint_record_repo,
-        model_endpoint_infra_gateway=model_endpoint_infra_gateway,
-        model_endpoint_cache_repository=model_endpoint_cache_repo,
-        async_model_endpoint_inference_gateway=async_model_endpoint_inference_gateway,
-        streaming_model_endpoint_inference_gateway=streaming_model_endpoint_inference_gateway,
-        sync_model_endpoint_inference_gateway=sync_model_endpoint_inference_gateway,
-        model_endpoints_schema_gateway=model_endpoints_schema_gateway,
-        inference_autoscaling_metrics_gateway=inference_autoscaling_metrics_gateway,
-    )
-    llm_model_endpoint_service = LiveLLMModelEndpointService(
-        model_endpoint_record_repository=model_endpoint_record_repo,
-        model_endpoint_service=model_endpoint_service,
-    )
-    model_bundle_repository = DbModelBundleRepository(session=session, read_only=read_only)
-    docker_image_batch_job_bundle_repository = DbDockerImageBatchJobBundleRepository(
-        session=session, read_only=read_only
-    )
-    batch_job_record_repository = DbBatchJobRecordRepository(session=session, read_only=read_only)
-    trigger_repository = DbTriggerRepository(session=session, read_only=read_only)
     batch_job_orchestration_gateway = LiveBatchJobOrchestrationGateway()
     batch_job_progress_gateway = LiveBatchJobProgressGateway(filesystem_gateway=filesystem_gateway)
-    batch_job_service = LiveBatchJobService(
-        batch_job_record_repository=batch_job_record_repository,
-        model_endpoint_service=model_endpoint_service,
-        batch_job_orchestration_gateway=batch_job_orchestration_gateway,
-        batch_job_progress_gateway=batch_job_progress_gateway,
-    )
 
     model_primitive_gateway = FakeModelPrimitiveGateway()
 
@@ -320,11 +301,6 @@ def _get_external_interfaces(
         if infra_config().cloud_provider == "azure"
         else S3FileLLMFineTuneEventsRepository()
     )
-    llm_fine_tuning_service = DockerImageBatchJobLLMFineTuningService(
-        docker_image_batch_job_gateway=docker_image_batch_job_gateway,
-        docker_image_batch_job_bundle_repo=docker_image_batch_job_bundle_repository,
-        llm_fine_tune_repository=llm_fine_tune_repository,
-    )
 
     llm_batch_completions_service = LiveLLMBatchCompletionsService(
         docker_image_batch_job_gateway=docker_image_batch_job_gateway
@@ -344,34 +320,139 @@ def _get_external_interfaces(
     else:
         docker_repository = ECRDockerRepository()
 
-    tokenizer_repository = LiveTokenizerRepository(llm_artifact_gateway=llm_artifact_gateway)
+    # Sharing the tokenizer repository lets its load_tokenizer cache hit across requests.
+    tokenizer_repository = LiveTokenizerRepository(llm_artifact_gateway=_get_llm_artifact_gateway())
 
     streaming_storage_gateway = FirehoseStreamingStorageGateway()
 
-    external_interfaces = ExternalInterfaces(
+    return _StatelessInterfaces(
+        inference_task_queue_gateway=inference_task_queue_gateway,
+        infra_task_queue_gateway=infra_task_queue_gateway,
+        monitoring_metrics_gateway=monitoring_metrics_gateway,
+        queue_delegate=queue_delegate,
+        async_model_endpoint_inference_gateway=async_model_endpoint_inference_gateway,
+        sync_model_endpoint_inference_gateway=sync_model_endpoint_inference_gateway,
+        streaming_model_endpoint_inference_gateway=streaming_model_endpoint_inference_gateway,
+        filesystem_gateway=filesystem_gateway,
+        model_endpoints_schema_gateway=model_endpoints_schema_gateway,
+        batch_job_orchestration_gateway=batch_job_orchestration_gateway,
+        batch_job_progress_gateway=batch_job_progress_gateway,
+        model_primitive_gateway=model_primitive_gateway,
+        docker_image_batch_job_gateway=docker_image_batch_job_gateway,
+        cron_job_gateway=cron_job_gateway,
+        llm_fine_tune_repository=llm_fine_tune_repository,
+        llm_fine_tune_events_repository=llm_fine_tune_events_repository,
+        llm_batch_completions_service=llm_batch_completions_service,
+        file_storage_gateway=file_storage_gateway,
         docker_repository=docker_repository,
+        tokenizer_repository=tokenizer_repository,
+        streaming_storage_gateway=streaming_storage_gateway,
+    )
+
+
+def _get_llm_artifact_gateway() -> LLMArtifactGateway:
+    return (
+        ABSLLMArtifactGateway()
+        if infra_config().cloud_provider == "azure"
+        else S3LLMArtifactGateway()
+    )
+
+
+def _get_external_interfaces(
+    read_only: bool, session: Callable[[], AsyncSession]
+) -> ExternalInterfaces:
+    """
+    Dependency that returns a ExternalInterfaces object. This allows repositories to share
+    sessions for the database and redis.
+    """
+    stateless = _get_stateless_interfaces()
+    model_endpoint_record_repo = DbModelEndpointRecordRepository(
+        monitoring_metrics_gateway=stateless.monitoring_metrics_gateway,
+        session=session,
+        read_only=read_only,
+    )
+
+    redis_client = aioredis.Redis(connection_pool=get_or_create_aioredis_pool())
+    inference_autoscaling_metrics_gateway = (
+        ASBInferenceAutoscalingMetricsGateway()
+        if infra_config().cloud_provider == "azure"
+        else RedisInferenceAutoscalingMetricsGateway(redis_client=redis_client)
+    )  # we can just reuse the existing redis client, we shouldn't get key collisions because of the prefix
+    resource_gateway = LiveEndpointResourceGateway(
+        queue_delegate=stateless.queue_delegate,
+        inference_autoscaling_metrics_gateway=inference_autoscaling_metrics_gateway,
+    )
+    model_endpoint_cache_repo = RedisModelEndpointCacheRepository(
+        redis_client=redis_client,
+    )
+    model_endpoint_response_cache_repo = RedisModelEndpointResponseCacheRepository(
+        redis_client=redis_client,
+    )
+    model_endpoint_infra_gateway = LiveModelEndpointInfraGateway(
+        resource_gateway=resource_gateway,
+        task_queue_gateway=stateless.infra_task_queue_gateway,
+    )
+    # Not shared: _infer_hardware memoizes on the gateway instance.
+    llm_artifact_gateway = _get_llm_artifact_gateway()
+    model_endpoint_service = LiveModelEndpointService(
+        model_endpoint_record_repository=model_endpoint_record_repo,
+        model_endpoint_infra_gateway=model_endpoint_infra_gateway,
+        model_endpoint_cache_repository=model_endpoint_cache_repo,
+        async_model_endpoint_inference_gateway=stateless.async_model_endpoint_inference_gateway,
+        streaming_model_endpoint_inference_gateway=stateless.streaming_model_endpoint_inference_gateway,
+        sync_model_endpoint_inference_gateway=stateless.sync_model_endpoint_inference_gateway,
+        model_endpoints_schema_gateway=stateless.model_endpoints_schema_gateway,
+        inference_autoscaling_metrics_gateway=inference_autoscaling_metrics_gateway,
+        model_endpoint_response_cache_repository=model_endpoint_response_cache_repo,
+    )
+    llm_model_endpoint_service = LiveLLMModelEndpointService(
+        model_endpoint_record_repository=model_endpoint_record_repo,
+        model_endpoint_service=model_endpoint_service,
+    )
+    model_bundle_repository = DbModelBundleRepository(session=session, read_only=read_only)
+    docker_image_batch_job_bundle_repository = DbDockerImageBatchJobBundleRepository(
+        session=session, read_only=read_only
+    )
+    batch_job_record_repository = DbBatchJobRecordRepository(session=session, read_only=read_only)
+    trigger_repository = DbTriggerRepository(session=session, read_only=read_only)
+    batch_job_service = LiveBatchJobService(
+        batch_job_record_repository=batch_job_record_repository,
+        model_endpoint_service=model_endpoint_service,
+        batch_job_orchestration_gateway=stateless.batch_job_orchestration_gateway,
+        batch_job_progress_gateway=stateless.batch_job_progress_gateway,
+    )
+
+    llm_fine_tuning_service = DockerImageBatchJobLLMFineTuningService(
+        docker_image_batch_job_gateway=stateless.docker_image_batch_job_gateway,
+        docker_image_batch_job_bundle_repo=docker_image_batch_job_bundle_repository,
+        llm_fine_tune_repository=stateless.llm_fine_tune_repository,
+    )
+
+    external_interfaces = ExternalInterfaces(
+        docker_repository=stateless.docker_repository,
         model_bundle_repository=model_bundle_repository,
         model_endpoint_service=model_endpoint_service,
         llm_model_endpoint_service=llm_model_endpoint_service,
-        llm_batch_completions_service=llm_batch_completions_service,
+        llm_batch_completions_service=stateless.llm_batch_completions_service,
         batch_job_service=batch_job_service,
         resource_gateway=resource_gateway,
-        endpoint_creation_task_queue_gateway=infra_task_queue_gateway,
-        inference_task_queue_gateway=inference_task_queue_gateway,
+        endpoint_creation_task_queue_gateway=stateless.infra_task_queue_gateway,
+        inference_task_queue_gateway=stateless.inference_task_queue_gateway,
         model_endpoint_infra_gateway=model_endpoint_infra_gateway,
-        model_primitive_gateway=model_primitive_gateway,
+        model_primitive_gateway=stateless.model_primitive_gateway,
         docker_image_batch_job_bundle_repository=docker_image_batch_job_bundle_repository,
-        docker_image_batch_job_gateway=docker_image_batch_job_gateway,
+        docker_image_batch_job_gateway=stateless.docker_image_batch_job_gateway,
         llm_fine_tuning_service=llm_fine_tuning_service,
-        llm_fine_tune_events_repository=llm_fine_tune_events_repository,
-        file_storage_gateway=file_storage_gateway,
-        filesystem_gateway=filesystem_gateway,
+        llm_fine_tune_events_repository=stateless.llm_fine_tune_events_repository,
+        file_storage_gateway=stateless.file_storage_gateway,
+        filesystem_gateway=stateless.filesystem_gateway,
         llm_artifact_gateway=llm_artifact_gateway,
         trigger_repository=trigger_repository,
-        cron_job_gateway=cron_job_gateway,
-        monitoring_metrics_gateway=monitoring_metrics_gateway,
-        tokenizer_repository=tokenizer_repository,
-        streaming_storage_gateway=streaming_storage_gateway,
+        cron_job_gateway=stateless.cron_job_gateway,
+        monitoring_metrics_gateway=stateless.monitoring_metrics_gateway,
+        tokenizer_repository=stateless.tokenizer_repository,
+        streaming_storage_gateway=stateless.streaming_storage_gateway,
+        model_endpoint_response_cache_repository=model_endpoint_response_cache_repo,
     )
     return external_interfaces
 
@@ -388,12 +469,22 @@ def get_default_external_interfaces_read_only() -> ExternalInterfaces:
     return _get_external_interfaces(read_only=True, session=session)
 
 
+async def _refresh_db_sessions_if_needed() -> None:
+    """
+    Creating or refreshing the DB sessions fetches credentials from the secrets store, which would
+    otherwise block the event loop, so do just that part in the threadpool.
+    """
+    if is_db_session_refresh_needed():
+        await run_in_threadpool(get_session_async)
+
+
 async def get_external_interfaces():
     try:
         from plugins.dependencies import get_external_interfaces as get_custom_external_interfaces
 
         yield get_custom_external_interfaces()
     except ModuleNotFoundError:
+        await _refresh_db_sessions_if_needed()
         yield get_default_external_interfaces()
     finally:
         pass
@@ -407,6 +498,7 @@ async def get_external_interfaces_read_only():
 
         yield get_custom_external_interfaces_read_only()
     except ModuleNotFoundError:
+        await _refresh_db_sessions_if_needed()
         yield get_default_external_interfaces_read_only()
     finally:
         pass
@@ -13,6 +13,7 @@ from model_engine_server.api.dependencies import (
     get_external_interfaces_read_only,
     verify_authentication,
 )
+from model_engine_server.api.routing import ORJSONRoute
 from model_engine_server.common.config import hmi_config
 from model_engine_server.common.dtos.llms import (
     CancelFineTuneResponse,
@@ -113,7 +114,9 @@ async def record_route_call(
     external_interfaces.monitoring_metrics_gateway.emit_route_call_metric(route, metric_metadata)
 
 
-llm_router_v1 = APIRouter(prefix="/v1/llm", dependencies=[Depends(record_route_call)])
+llm_router_v1 = APIRouter(
+    prefix="/v1/llm", dependencies=[Depends(record_route_call)], route_class=ORJSONRoute
+)
 logger = make_logger(logger_name())
 
 
@@ -4,15 +4,17 @@ List model endpoint history: GET model-endpoints/<endpoint id>/history
 Read model endpoint creation logs: GET model-endpoints/<endpoint id>/creation-logs
 """
 
+import hashlib
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from model_engine_server.api.dependencies import (
     ExternalInterfaces,
     get_external_interfaces,
     get_external_interfaces_read_only,
     verify_authentication,
 )
+from model_engine_server.api.routing import ORJSONRoute
 from model_engine_server.common.dtos.model_endpoints import (
     CreateModelEndpointV1Request,
     CreateModelEndpointV1Response,
@@ -45,9 +47,43 @@ from model_engine_server.domain.use_cases.model_endpoint_use_cases import (
     UpdateModelEndpointByIdV1UseCase,
 )
 
-model_endpoint_router_v1 = APIRouter(prefix="/v1")
+model_endpoint_router_v1 = APIRouter(prefix="/v1", route_class=ORJSONRoute)
 logger = make_logger(logger_name())
 
+MODEL_ENDPOINT_RESPONSE_CACHE_TTL_SECONDS = 30
+MAX_LIST_MODEL_ENDPOINTS_LIMIT = 500
+
+# Error details are static, so build them once. The HTTPExceptions themselves are still created per
+# raise, since `raise ... from exc` writes __cause__ and __traceback__ onto the instance.
+_ENDPOINT_ALREADY_EXISTS = "The specified model endpoint already exists."
+_BUNDLE_NOT_FOUND = "The specified model bundle could not be found."
+_ENDPOINT_OR_BUNDLE_NOT_FOUND = "The specified model endpoint or model bundle was not found."
+_OPERATION_IN_PROGRESS = "Existing operation on endpoint in progress, try again later."
+_INFRA_STATE_NOT_FOUND = "Endpoint infra state not found, try again later."
+_DELETE_FAILED = "deletion of endpoint failed, compute resources still exist."
+_ENDPOINT_NOT_FOUND_TEMPLATE = "Model Endpoint {}  was not found."
+
+
+def _endpoint_not_found(model_endpoint_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=404, detail=_ENDPOINT_NOT_FOUND_TEMPLATE.format(model_endpoint_id)
+    )
+
+
+def _cached_json_response(body: bytes, if_none_match: Optional[str]) -> Response:
+    """
+    Wraps an already-serialized response body with an ETag, answering with a 304 if the client
+    already holds the current version.
+    """
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={MODEL_ENDPOINT_RESPONSE_CACHE_TTL_SECONDS}",
+    }
+    if if_none_match is not None and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @model_endpoint_router_v1.post("/model-endpoints", response_model=CreateModelEndpointV1Response)
 async def create_model_endpoint(
@@ -58,7 +94,8 @@ async def create_model_endpoint(
     """
     Creates a Model for the current user.
     """
-    logger.info(f"POST /model-endpoints with {request} for {auth}")
+    logger.info("POST /model-endpoints with name=%s for %s", request.name, auth)
+    logger.debug("POST /model-endpoints request: %s", request)
     try:
         use_case = CreateModelEndpointV1UseCase(
             model_bundle_repository=external_interfaces.model_bundle_repository,
@@ -66,10 +103,7 @@ async def create_model_endpoint(
         )
         return await use_case.execute(user=auth, request=request)
     except ObjectAlreadyExistsException as exc:
-        raise HTTPException(
-            status_code=400,
-            detail="The specified model endpoint already exists.",
-        ) from exc
+        raise HTTPException(status_code=400, detail=_ENDPOINT_ALREADY_EXISTS) from exc
     except (
         EndpointLabelsException,
         ObjectHasInvalidValueException,
@@ -80,27 +114,39 @@ async def create_model_endpoint(
             detail=str(exc),
         ) from exc
     except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
-        raise HTTPException(
-            status_code=404,
-            detail="The specified model bundle could not be found.",
-        ) from exc
+        raise HTTPException(status_code=404, detail=_BUNDLE_NOT_FOUND) from exc
 
 
 @model_endpoint_router_v1.get("/model-endpoints", response_model=ListModelEndpointsV1Response)
 async def list_model_endpoints(
     name: Optional[str] = Query(default=None),
     order_by: Optional[ModelEndpointOrderBy] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_LIST_MODEL_ENDPOINTS_LIMIT),
+    cursor: Optional[str] = Query(default=None),
     auth: User = Depends(verify_authentication),
     external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
 ) -> ListModelEndpointsV1Response:
     """
-    Lists the Models owned by the current owner.
+    Lists the Models owned by the current owner. Pass limit (and the returned next_cursor as
+    cursor) to page through them.
     """
-    logger.info(f"GET /model-endpoints?name={name}&order_by={order_by} for {auth}")
+    logger.info(
+        "GET /model-endpoints?name=%s&order_by=%s&limit=%s&cursor=%s for %s",
+        name,
+        order_by,
+        limit,
+        cursor,
+        auth,
+    )
     use_case = ListModelEndpointsV1UseCase(
         model_endpoint_service=external_interfaces.model_endpoint_service,
     )
-    return await use_case.execute(user=auth, name=name, order_by=order_by)
+    try:
+        return await use_case.execute(
+            user=auth, name=name, order_by=order_by, limit=limit, cursor=cursor
+        )
+    except ObjectHasInvalidValueException as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @model_endpoint_router_v1.get(
@@ -108,23 +154,37 @@ async def list_model_endpoints(
 )
 async def get_model_endpoint(
     model_endpoint_id: str,
+    if_none_match: Optional[str] = Header(default=None),
     auth: User = Depends(verify_authentication),
     external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
-) -> GetModelEndpointV1Response:
+) -> Response:
     """
     Describe the Model endpoint with given ID.
     """
-    logger.info(f"GET /model-endpoints/{model_endpoint_id} for {auth}")
-    try:
-        use_case = GetModelEndpointByIdV1UseCase(
-            model_endpoint_service=external_interfaces.model_endpoint_service
+    logger.info("GET /model-endpoints/%s for %s", model_endpoint_id, auth)
+    response_cache = external_interfaces.model_endpoint_response_cache_repository
+    # The generation is read before the DB, so the write below is dropped if the endpoint was
+    # updated or deleted (and invalidated) while this response was being rendered.
+    body, generation = await response_cache.read_model_endpoint_response(
+        model_endpoint_id=model_endpoint_id, owner=auth.team_id
+    )
+    if body is None:
+        try:
+            use_case = GetModelEndpointByIdV1UseCase(
+                model_endpoint_service=external_interfaces.model_endpoint_service
+            )
+            response = await use_case.execute(user=auth, model_endpoint_id=model_endpoint_id)
+        except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
+            raise _endpoint_not_found(model_endpoint_id) from exc
+        body = response.model_dump_json().encode("utf-8")
+        await response_cache.write_model_endpoint_response(
+            model_endpoint_id=model_endpoint_id,
+            owner=auth.team_id,
+            response=body,
+            ttl_seconds=MODEL_ENDPOINT_RESPONSE_CACHE_TTL_SECONDS,
+            generation=generation,
         )
-        return await use_case.execute(user=auth, model_endpoint_id=model_endpoint_id)
-    except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Model Endpoint {model_endpoint_id}  was not found.",
-        ) from exc
+    return _cached_json_response(body, if_none_match)
 
 
 @model_endpoint_router_v1.put(
@@ -139,7 +199,8 @@ async def update_model_endpoint(
     """
     Lists the Models owned by the current owner.
     """
-    logger.info(f"PUT /model-endpoints/{model_endpoint_id} with {request} for {auth}")
+    logger.info("PUT /model-endpoints/%s for %s", model_endpoint_id, auth)
+    logger.debug("PUT /model-endpoints/%s request: %s", model_endpoint_id, request)
     try:
         use_case = UpdateModelEndpointByIdV1UseCase(
             model_bundle_repository=external_interfaces.model_bundle_repository,
@@ -159,20 +220,11 @@ async def update_model_endpoint(
             detail=str(exc),
         ) from exc
     except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
-        raise HTTPException(
-            status_code=404,
-            detail="The specified model endpoint or model bundle was not found.",
-        ) from exc
+        raise HTTPException(status_code=404, detail=_ENDPOINT_OR_BUNDLE_NOT_FOUND) from exc
     except ExistingEndpointOperationInProgressException as exc:
-        raise HTTPException(
-            status_code=409,
-            detail="Existing operation on endpoint in progress, try again later.",
-        ) from exc
+        raise HTTPException(status_code=409, detail=_OPERATION_IN_PROGRESS) from exc
     except EndpointInfraStateNotFound as exc:
-        raise HTTPException(
-            status_code=500,
-            detail="Endpoint infra state not found, try again later.",
-        ) from exc
+        raise HTTPException(status_code=500, detail=_INFRA_STATE_NOT_FOUND) from exc
 
 
 @model_endpoint_router_v1.delete(
@@ -186,24 +238,15 @@ async def delete_model_endpoint(
     """
     Lists the Models owned by the current owner.
     """
-    logger.info(f"DELETE /model-endpoints/{model_endpoint_id} for {auth}")
+    logger.info("DELETE /model-endpoints/%s for %s", model_endpoint_id, auth)
     try:
         use_case = DeleteModelEndpointByIdV1UseCase(
             model_endpoint_service=external_interfaces.model_endpoint_service,
         )
         return await use_case.execute(user=auth, model_endpoint_id=model_endpoint_id)
     except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Model Endpoint {model_endpoint_id}  was not found.",
-        ) from exc
+        raise _endpoint_not_found(model_endpoint_id) from exc
     except ExistingEndpointOperationInProgressException as exc:
-        raise HTTPException(
-            status_code=409,
-            detail="Existing operation on endpoint in progress, try again later.",
-        ) from exc
+        raise HTTPException(status_code=409, detail=_OPERATION_IN_PROGRESS) from exc
     except EndpointDeleteFailedException as exc:  # pragma: no cover
-        raise HTTPException(
-            status_code=500,
-            detail="deletion of endpoint failed, compute resources still exist.",
-        ) from exc
+        raise HTTPException(status_code=500, detail=_DELETE_FAILED) from exc
@@ -5,6 +5,7 @@ from model_engine_server.api.dependencies import (
     get_external_interfaces_read_only,
     verify_authentication,
 )
+from model_engine_server.api.routing import ORJSONRoute
 from model_engine_server.common.dtos.llms.batch_completion import (
     CancelBatchCompletionsV2Response,
     CreateBatchCompletionsV2Request,
@@ -34,7 +35,7 @@ logger = make_logger(logger_name())
 
 
 batch_completions_router_v2 = APIRouter(
-    prefix="/batch-completions", dependencies=[Depends(record_route_call)]
+    prefix="/batch-completions", dependencies=[Depends(record_route_call)], route_class=ORJSONRoute
 )
 
 
@@ -9,6 +9,15 @@ logger = make_logger(logger_name())
 
 
 class MultiprocessingConcurrencyLimiter:
+    """
+    Caps the number of in-flight requests across every process that shares the semaphore.
+
+    With fail_on_concurrency_limit=True (the gateway and the http forwarder), entering the limiter
+    is a single non-blocking sem_trywait on the POSIX semaphore, which is atomic and takes no
+    mutex. An unlocked read of the count ahead of it would not be cheaper, and would let
+    concurrent requests overshoot the cap.
+    """
+
     def __init__(self, concurrency: Optional[int], fail_on_concurrency_limit: bool):
         self.concurrency = concurrency
         if concurrency is not None:
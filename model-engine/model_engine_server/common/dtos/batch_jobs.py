@@ -5,7 +5,6 @@ DTOs for the batch job abstraction.
 from datetime import datetime, timedelta
 from typing import Any, Collection, Dict, List, Optional
 
-from model_engine_server.common import dict_not_none
 from model_engine_server.common.pydantic_types import BaseModel, ConfigDict, model_validator
 from model_engine_server.domain.entities import (
     BatchJobSerializationFormat,
@@ -73,8 +72,8 @@ class CreateDockerImageBatchJobResourceRequests(BaseModel):
         default_requests: "CreateDockerImageBatchJobResourceRequests",
         override_requests: "CreateDockerImageBatchJobResourceRequests",
     ) -> "CreateDockerImageBatchJobResourceRequests":
-        default_dict = dict_not_none(**default_requests.dict())
-        override_dict = dict_not_none(**override_requests.dict())
+        default_dict = default_requests.model_dump(exclude_none=True)
+        override_dict = override_requests.model_dump(exclude_none=True)
         default_dict.update(override_dict)
         return CreateDockerImageBatchJobResourceRequests.parse_obj(default_dict)
 
@@ -84,8 +83,8 @@ class CreateDockerImageBatchJobResourceRequests(BaseModel):
         requests_1: "CreateDockerImageBatchJobResourceRequests",
         requests_2: "CreateDockerImageBatchJobResourceRequests",
     ) -> Collection[str]:
-        dict_1 = dict_not_none(**requests_1.dict())
-        dict_2 = dict_not_none(**requests_2.dict())
+        dict_1 = requests_1.model_dump(exclude_none=True)
+        dict_2 = requests_2.model_dump(exclude_none=True)
         return set(dict_1.keys()).intersection(dict_2.keys())
 
 
@@ -1,6 +1,6 @@
 # Make sure to keep this in sync with inference/batch_inference/dto.py.
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from model_engine_server.common.dtos.llms.chat_completion import (
     ChatCompletionV2Request,
@@ -12,8 +12,15 @@ from model_engine_server.common.dtos.llms.completion import (
     CompletionV2Response,
 )
 from model_engine_server.common.dtos.llms.vllm import VLLMModelConfig
-from model_engine_server.common.pydantic_types import BaseModel, ConfigDict, Field
-from typing_extensions import TypeAlias
+from model_engine_server.common.pydantic_types import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+)
+from typing_extensions import Annotated, TypeAlias
 
 
 # Common DTOs for batch completions
@@ -42,6 +49,8 @@ class ToolConfig(BaseModel):
 
 
 class BatchCompletionsModelConfig(VLLMModelConfig):
+    model_config = ConfigDict(frozen=True)
+
     model: str = Field(
         description="ID of the model to use.",
         examples=["mixtral-8x7b-instruct"],
@@ -125,7 +134,7 @@ class CreateBatchCompletionsV1ModelConfig(BatchCompletionsModelConfig):
 
 
 class CreateBatchCompletionsV1RequestContent(BaseModel):
-    prompts: List[str]
+    prompts: Annotated[List[str], Field(min_length=1)]
     max_new_tokens: int
     temperature: float = Field(ge=0.0, le=1.0)
     """
@@ -199,14 +208,59 @@ class FilteredChatCompletionV2Request(ChatCompletionV2Request):
 # V2 DTOs for batch completions
 CompletionRequest: TypeAlias = Union[FilteredCompletionV2Request, FilteredChatCompletionV2Request]
 CompletionResponse: TypeAlias = Union[CompletionV2Response, ChatCompletionV2SyncResponse]
-CreateBatchCompletionsV2RequestContent: TypeAlias = Union[
-    List[FilteredCompletionV2Request], List[FilteredChatCompletionV2Request]
+
+
+def _get_v2_content_tag(content: Any) -> Optional[str]:
+    """
+    Picks the V2 content variant from its first item, so that pydantic validates the list against
+    a single request type instead of trying both.
+    """
+    if not isinstance(content, (list, tuple)):
+        return None
+    if not content:
+        return "completion"
+    first = content[0]
+    if isinstance(first, dict):
+        return "chat" if "messages" in first else "completion"
+    return "chat" if isinstance(first, ChatCompletionV2Request) else "completion"
+
+
+CreateBatchCompletionsV2RequestContent: TypeAlias = Annotated[
+    Union[
+        Annotated[List[FilteredCompletionV2Request], Tag("completion")],
+        Annotated[List[FilteredChatCompletionV2Request], Tag("chat")],
+    ],
+    Discriminator(_get_v2_content_tag),
 ]
 CreateBatchCompletionsV2ModelConfig: TypeAlias = BatchCompletionsModelConfig
-BatchCompletionContent = Union[
-    CreateBatchCompletionsV1RequestContent, CreateBatchCompletionsV2RequestContent
+
+
+def _get_batch_completion_content_tag(content: Any) -> Optional[str]:
+    """
+    V1 content is a single object and V2 content is a list, so the shape alone tells them apart.
+    This keeps the API untagged while letting pydantic skip the variants that can't match.
+    """
+    if isinstance(content, (dict, CreateBatchCompletionsV1RequestContent)):
+        return "v1"
+    if isinstance(content, (list, tuple)):
+        return "v2"
+    return None
+
+
+BatchCompletionContent: TypeAlias = Annotated[
+    Union[
+        Annotated[CreateBatchCompletionsV1RequestContent, Tag("v1")],
+        Annotated[CreateBatchCompletionsV2RequestContent, Tag("v2")],
+    ],
+    Discriminator(_get_batch_completion_content_tag),
 ]
 
+# Shared validator for content that doesn't arrive as part of a request, e.g. the input_data_path
+# file read by the batch job.
+BatchCompletionContentTypeAdapter: TypeAdapter[BatchCompletionContent] = TypeAdapter(
+    BatchCompletionContent
+)
+
 
 class CreateBatchCompletionsV2Request(BatchCompletionsRequestBase):
     """
@@ -239,6 +293,8 @@ class BatchCompletionsJobStatus(str, Enum):
 
 
 class BatchCompletionsJob(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     job_id: str
     input_data_path: Optional[str] = Field(
         default=None,
@@ -316,7 +372,7 @@ class CreateBatchCompletionsEngineRequest(BatchCompletionsRequestBase, VLLMEngin
     hidden from the DTO exposed to the client.
     """
 
-    model_config = ConfigDict(populate_by_name=True, protected_namespaces=())
+    model_config = ConfigDict(populate_by_name=True, frozen=True, protected_namespaces=())
 
     content: Optional[BatchCompletionContent] = Field(
         default=None,
@@ -328,15 +384,16 @@ class CreateBatchCompletionsEngineRequest(BatchCompletionsRequestBase, VLLMEngin
         description="""Model configuration for the batch inference. Hardware configurations are inferred.""",
     )
 
+    # The factories below only copy fields off of an already-validated API request, so they use
+    # model_construct to skip re-running validation over the (potentially large) content.
     @staticmethod
     def from_api_v1(
         request: CreateBatchCompletionsV1Request,
     ) -> "CreateBatchCompletionsEngineRequest":
-        return CreateBatchCompletionsEngineRequest(
+        return CreateBatchCompletionsEngineRequest.model_construct(
             input_data_path=request.input_data_path,
             output_data_path=request.output_data_path,
             content=request.content,
-            model_config=request.model_cfg,
             model_cfg=request.model_cfg,
             data_parallelism=request.data_parallelism,
             max_runtime_sec=request.max_runtime_sec,
@@ -349,11 +406,10 @@ class CreateBatchCompletionsEngineRequest(BatchCompletionsRequestBase, VLLMEngin
     def from_api_v2(
         request: CreateBatchCompletionsV2Request,
     ) -> "CreateBatchCompletionsEngineRequest":
-        return CreateBatchCompletionsEngineRequest(
+        return CreateBatchCompletionsEngineRequest.model_construct(
             input_data_path=request.input_data_path,
             output_data_path=request.output_data_path,
             content=request.content,
-            model_config=request.model_cfg,
             model_cfg=request.model_cfg,
             data_parallelism=request.data_parallelism,
             max_runtime_sec=request.max_runtime_sec,
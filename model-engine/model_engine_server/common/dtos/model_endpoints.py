@@ -127,6 +127,7 @@ class GetModelEndpointV1Response(BaseModel):
 
 class ListModelEndpointsV1Response(BaseModel):
     model_endpoints: List[GetModelEndpointV1Response]
+    next_cursor: Optional[str] = Field(default=None)
 
 
 class DeleteModelEndpointV1Response(BaseModel):
@@ -1,5 +1,4 @@
 import contextvars
-import inspect
 import logging
 import os
 import sys
@@ -186,23 +185,19 @@ def logger_name(*, fallback_name: Optional[str] = None) -> str:
           the logger name cannot be inferred from the calling __main__ module, this value will be used
           instead of raising a ValueError.
     """
-    # Get the module where the calling function is defined.
-    # https://stackoverflow.com/questions/1095543/get-name-of-calling-functions-module-in-python
-    stack = inspect.stack()
-    calling_frame = stack[1]
-    calling_module = inspect.getmodule(calling_frame[0])
-    if calling_module is None:
-        raise ValueError(
-            f"Cannot obtain module from calling function. Tried to use calling frame {calling_frame}"
-        )
+    # Read the caller's module globals straight off its frame: inspect.stack() would build a
+    # FrameInfo (including source context) for every frame on the stack, at every import.
+    calling_globals = sys._getframe(1).f_globals
     # we try to use this module's name
-    name = calling_module.__name__
+    name = calling_globals.get("__name__")
+    if name is None:
+        raise ValueError("Cannot obtain module name from the calling frame's globals!")
     if name == "__main__":
         # unless logger_name was called from an executing script,
         # in which case we use it's file name
 
-        if hasattr(calling_module, "__file__"):
-            return _filename_wo_ext(calling_module.__file__)  # type: ignore
+        if calling_globals.get("__file__"):
+            return _filename_wo_ext(calling_globals["__file__"])
         if fallback_name is not None:
             fallback_name = fallback_name.strip()
             if len(fallback_name) > 0:
@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from typing import Iterator, Optional
@@ -145,6 +146,9 @@ class DBManager:
         self.max_overflow = infra_config.db_engine_max_overflow
         self.echo = infra_config.db_engine_echo
         self.echo_pool = infra_config.db_engine_echo_pool
+        # Refreshes can run concurrently from the threadpool; only one of them should swap out and
+        # dispose the engines.
+        self._refresh_lock = threading.Lock()
         self.sessions = self.refresh_sessions()
 
     def refresh_sessions(self) -> DBSessions:
@@ -248,7 +252,8 @@ class DBManager:
             session_async_null_pool=session_async_null_pool,
         )
 
-    def _is_credentials_expired(self):
+    def is_credentials_expired(self) -> bool:
+        """Whether the next session lookup will refresh the DB credentials and engines first."""
         return (
             self.credential_expiration_timestamp is not None
             and time.time()
@@ -256,7 +261,12 @@ class DBManager:
         )
 
     def _maybe_refresh_sessions(self):
-        if self._is_credentials_expired():
+        if not self.is_credentials_expired():
+            return
+        with self._refresh_lock:
+            # Another thread may have refreshed while this one waited for the lock.
+            if not self.is_credentials_expired():
+                return
             old_sessions = self.sessions
             self.sessions = self.refresh_sessions()
             old_sessions.session_sync.engine.dispose()
@@ -287,12 +297,15 @@ class DBManager:
 
 
 db_manager: Optional[DBManager] = None
+_db_manager_lock = threading.Lock()
 
 
 def get_db_manager():
     global db_manager
     if db_manager is None:
-        db_manager = DBManager(infra_config())
+        with _db_manager_lock:
+            if db_manager is None:
+                db_manager = DBManager(infra_config())
     return db_manager
 
 
@@ -304,6 +317,11 @@ def get_session_read_only():
     return get_db_manager().get_session_sync_ro()
 
 
+def is_db_session_refresh_needed() -> bool:
+    """Whether the next session lookup will (blockingly) fetch fresh DB credentials first."""
+    return db_manager is None or db_manager.is_credentials_expired()
+
+
 def get_session_async():
     return get_db_manager().get_session_async()
 
@@ -3,9 +3,8 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
 from fastapi.openapi.models import OpenAPI
-from model_engine_server.common import dict_not_none
 from model_engine_server.common.pydantic_types import BaseModel, Field, RootModel
-from model_engine_server.common.serialization_utils import b64_to_python_json, python_json_to_b64
+from model_engine_server.common.serialization_utils import b64_to_str, str_to_b64
 from model_engine_server.domain.entities.common_types import (
     CpuSpecificationType,
     StorageSpecificationType,
@@ -94,11 +93,11 @@ class ModelEndpointConfig(BaseModel):
     labels: Optional[Dict[str, str]] = None
 
     def serialize(self) -> str:
-        return python_json_to_b64(dict_not_none(**self.dict()))
+        return str_to_b64(self.model_dump_json(exclude_none=True))
 
     @staticmethod
     def deserialize(serialized_config: str) -> "ModelEndpointConfig":
-        return ModelEndpointConfig.parse_obj(b64_to_python_json(serialized_config))
+        return ModelEndpointConfig.model_validate_json(b64_to_str(serialized_config))
 
 
 class ModelEndpointUserConfigState(BaseModel):
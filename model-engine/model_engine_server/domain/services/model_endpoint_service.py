@@ -1,6 +1,7 @@
 # Represents high-level CRUD operations for model endpoints.
+import datetime
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from model_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
 from model_engine_server.domain.entities import (
@@ -184,6 +185,8 @@ class ModelEndpointService(ABC):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime.datetime, str]] = None,
     ) -> List[ModelEndpoint]:
         """
         Lists model endpoints.
@@ -191,6 +194,10 @@ class ModelEndpointService(ABC):
             owner: The user ID of the owner of the endpoints.
             name: An optional name of the endpoint used for filtering endpoints.
             order_by: The ordering to output the Model Endpoints.
+            limit: An optional maximum number of Model Endpoints to return.
+            after: An optional (created_at, id) key; only Model Endpoints strictly after it in
+                the output ordering are returned. Endpoints are ordered by (created_at, id), newest
+                first unless order_by is OLDEST, whenever limit or after is given.
         Returns:
             A Model Endpoint Record domain entity, or None if not found.
         """
@@ -2928,8 +2928,12 @@ class CreateBatchCompletionsUseCase:
                 "Data parallelism is disabled for batch completions."
             )
 
-        request.model_cfg.checkpoint_path = get_checkpoint_path(
-            request.model_cfg.model, request.model_cfg.checkpoint_path
+        request.model_cfg = request.model_cfg.model_copy(
+            update={
+                "checkpoint_path": get_checkpoint_path(
+                    request.model_cfg.model, request.model_cfg.checkpoint_path
+                )
+            }
         )
         hardware = await _infer_hardware(
             self.llm_artifact_gateway,
@@ -2941,7 +2945,6 @@ class CreateBatchCompletionsUseCase:
         assert hardware.gpus is not None
 
         engine_request = CreateBatchCompletionsEngineRequest.from_api_v1(request)
-        engine_request.model_cfg.num_shards = hardware.gpus
         if engine_request.tool_config and engine_request.tool_config.name != "code_evaluator":
             raise ObjectHasInvalidValueException(
                 "Only code_evaluator tool is supported for batch completions."
@@ -2951,10 +2954,15 @@ class CreateBatchCompletionsUseCase:
             engine_request.model_cfg.model
         )
 
-        engine_request.max_gpu_memory_utilization = (
-            additional_engine_args.max_gpu_memory_utilization
+        engine_request = engine_request.model_copy(
+            update={
+                "model_cfg": engine_request.model_cfg.model_copy(
+                    update={"num_shards": hardware.gpus}
+                ),
+                "max_gpu_memory_utilization": additional_engine_args.max_gpu_memory_utilization,
+                "attention_backend": additional_engine_args.attention_backend,
+            }
         )
-        engine_request.attention_backend = additional_engine_args.attention_backend
 
         batch_bundle = await self.create_batch_job_bundle(user, engine_request, hardware)
 
@@ -3001,8 +3009,12 @@ class CreateBatchCompletionsV2UseCase:
     async def execute(
         self, request: CreateBatchCompletionsV2Request, user: User
     ) -> CreateBatchCompletionsV2Response:
-        request.model_cfg.checkpoint_path = get_checkpoint_path(
-            request.model_cfg.model, request.model_cfg.checkpoint_path
+        request.model_cfg = request.model_cfg.model_copy(
+            update={
+                "checkpoint_path": get_checkpoint_path(
+                    request.model_cfg.model, request.model_cfg.checkpoint_path
+                )
+            }
         )
         hardware = await _infer_hardware(
             self.llm_artifact_gateway,
@@ -3013,7 +3025,18 @@ class CreateBatchCompletionsV2UseCase:
         )
 
         engine_request = CreateBatchCompletionsEngineRequest.from_api_v2(request)
-        engine_request.model_cfg.num_shards = hardware.gpus
+        additional_engine_args = infer_addition_engine_args_from_model_name(
+            engine_request.model_cfg.model
+        )
+        engine_request = engine_request.model_copy(
+            update={
+                "model_cfg": engine_request.model_cfg.model_copy(
+                    update={"num_shards": hardware.gpus}
+                ),
+                "max_gpu_memory_utilization": additional_engine_args.max_gpu_memory_utilization,
+                "attention_backend": additional_engine_args.attention_backend,
+            }
+        )
 
         validate_resource_requests(
             bundle=None,
@@ -3031,14 +3054,6 @@ class CreateBatchCompletionsV2UseCase:
         image_repo = hmi_config.batch_inference_vllm_repository
         image_tag = await _get_latest_batch_v2_tag(LLMInferenceFramework.VLLM)
 
-        additional_engine_args = infer_addition_engine_args_from_model_name(
-            engine_request.model_cfg.model
-        )
-        engine_request.max_gpu_memory_utilization = (
-            additional_engine_args.max_gpu_memory_utilization
-        )
-        engine_request.attention_backend = additional_engine_args.attention_backend
-
         return await self.llm_batch_completions_service.create_batch_job(
             user=user,
             job_request=engine_request,
@@ -167,7 +167,7 @@ class CreateModelBundleV1UseCase:
             # LEGACY FIELDS
             location=request.location,
             requirements=request.requirements,
-            env_params=request.env_params.dict(),
+            env_params=request.env_params.model_dump(),
             packaging_type=request.packaging_type or ModelBundlePackagingType.CLOUDPICKLE,
             app_config=request.app_config,
         )
@@ -219,7 +219,7 @@ class CloneModelBundleV1UseCase:
 
         env_params_dict = {}
         if (env_params := original_bundle.env_params) is not None:
-            env_params_dict = env_params.dict()
+            env_params_dict = env_params.model_dump()
 
         new_model_bundle = await self.model_bundle_repository.create_model_bundle(
             name=original_bundle.name,
@@ -422,7 +422,7 @@ class CreateModelBundleV2UseCase:
         if isinstance(request.flavor, ArtifactLike):
             location = request.flavor.location
             requirements = request.flavor.requirements
-            env_params = request.flavor.framework.dict()
+            env_params = request.flavor.framework.model_dump()
             # Rename image_repository to ecr_repo for legacy naming
             if "image_repository" in env_params:
                 env_params["ecr_repo"] = env_params.pop("image_repository")
@@ -504,7 +504,7 @@ class CloneModelBundleV2UseCase:
 
         env_params_dict = {}
         if (env_params := original_bundle.env_params) is not None:
-            env_params_dict = env_params.dict()
+            env_params_dict = env_params.model_dump()
 
         new_metadata = original_bundle.metadata.copy()
         new_metadata["__cloned_from_bundle_id"] = original_bundle.id
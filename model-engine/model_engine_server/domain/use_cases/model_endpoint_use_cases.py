@@ -4,9 +4,12 @@ List model endpoint history: GET model-endpoints/<endpoint id>/history
 Read model endpoint creation logs: GET model-endpoints/<endpoint id>/creation-logs
 """
 
+import base64
+import datetime
+import json
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from model_engine_server.common.constants import SUPPORTED_POST_INFERENCE_HOOKS
 from model_engine_server.common.dtos.model_endpoints import (
@@ -28,6 +31,7 @@ from model_engine_server.domain.authorization.live_authorization_module import (
 )
 from model_engine_server.domain.entities import (
     ModelEndpoint,
+    ModelEndpointRecord,
     ModelEndpointType,
     StreamingEnhancedRunnableImageFlavor,
 )
@@ -386,7 +390,7 @@ class UpdateModelEndpointByIdV1UseCase:
         # infra_state to make sure that after the update, all resources are valid and in sync.
         # E.g. If user only want to update gpus and leave gpu_type as None, we use the existing gpu_type
         # from infra_state to avoid passing in None to validate_resource_requests.
-        raw_request = request.dict(exclude_unset=True)
+        raw_request = request.model_dump(exclude_unset=True)
         validate_resource_requests(
             bundle=bundle,
             cpus=(request.cpus if "cpus" in raw_request else infra_state.resource_state.cpus),
@@ -447,6 +451,24 @@ class UpdateModelEndpointByIdV1UseCase:
         )
 
 
+def _encode_list_model_endpoints_cursor(record: ModelEndpointRecord) -> str:
+    return base64.urlsafe_b64encode(
+        json.dumps([record.created_at.isoformat(), record.id]).encode("utf-8")
+    ).decode("utf-8")
+
+
+def _decode_list_model_endpoints_cursor(cursor: str) -> Tuple[datetime.datetime, str]:
+    try:
+        created_at, model_endpoint_id = json.loads(base64.urlsafe_b64decode(cursor))
+        after = datetime.datetime.fromisoformat(created_at)
+    except (TypeError, ValueError) as exc:
+        raise ObjectHasInvalidValueException(f"Invalid cursor {cursor}") from exc
+    # Cursors are compared against record timestamps, so always hand them out as UTC-aware.
+    if after.tzinfo is None:
+        after = after.replace(tzinfo=datetime.timezone.utc)
+    return after.astimezone(datetime.timezone.utc), str(model_endpoint_id)
+
+
 class ListModelEndpointsV1UseCase:
     """
     Use case for listing all versions of a Model Endpoint of a given user and model endpoint name.
@@ -456,7 +478,12 @@ class ListModelEndpointsV1UseCase:
         self.model_endpoint_service = model_endpoint_service
 
     async def execute(
-        self, user: User, name: Optional[str], order_by: Optional[ModelEndpointOrderBy]
+        self,
+        user: User,
+        name: Optional[str],
+        order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> ListModelEndpointsV1Response:
         """
         Runs the use case to list all Model Endpoints owned by the user with the given name.
@@ -465,17 +492,34 @@ class ListModelEndpointsV1UseCase:
             user: The owner of the model endpoint(s).
             name: The name of the Model Endpoint(s).
             order_by: An optional argument to specify the output ordering of the model endpoints.
+            limit: An optional maximum number of model endpoints to return. If there are more,
+                the response contains a next_cursor to fetch the next page with.
+            cursor: The next_cursor from a previous response.
 
         Returns:
             A response object that contains the model endpoints.
+
+        Raises:
+            ObjectHasInvalidValueException: if the cursor is malformed.
         """
+        after = None if cursor is None else _decode_list_model_endpoints_cursor(cursor)
+        # Ask for one extra endpoint to know whether there is a next page.
         model_endpoints = await self.model_endpoint_service.list_model_endpoints(
-            owner=user.team_id, name=name, order_by=order_by
+            owner=user.team_id,
+            name=name,
+            order_by=order_by,
+            limit=None if limit is None else limit + 1,
+            after=after,
         )
+        next_cursor = None
+        if limit is not None and len(model_endpoints) > limit:
+            model_endpoints = model_endpoints[:limit]
+            next_cursor = _encode_list_model_endpoints_cursor(model_endpoints[-1].record)
         return ListModelEndpointsV1Response(
             model_endpoints=[
                 model_endpoint_entity_to_get_model_endpoint_response(m) for m in model_endpoints
-            ]
+            ],
+            next_cursor=next_cursor,
         )
 
 
@@ -5,9 +5,34 @@ You can do this with `start-fastapi-server`.
 """
 
 import argparse
+import math
+import os
 import subprocess
 from typing import List
 
+from model_engine_server.inference.utils import get_container_cpu_quota
+
+# Used when neither WEB_CONCURRENCY nor a CPU quota is available, e.g. pods that only set CPU
+# requests, where the visible core count is the whole node's.
+DEFAULT_NUM_WORKERS = 4
+# Each worker holds its own DB connection pools, so keep the derived count well below what would
+# exhaust the Postgres max_connections.
+MAX_NUM_WORKERS = 16
+
+
+def get_default_num_workers() -> int:
+    """
+    Returns WEB_CONCURRENCY if set. Otherwise, if the container has a CPU limit, the usual
+    2 * cores + 1 for I/O-bound workers, capped at MAX_NUM_WORKERS; else DEFAULT_NUM_WORKERS.
+    """
+    web_concurrency = os.getenv("WEB_CONCURRENCY")
+    if web_concurrency:
+        return int(web_concurrency)
+    cpu_quota = get_container_cpu_quota()
+    if cpu_quota is None:
+        return DEFAULT_NUM_WORKERS
+    return min(2 * max(math.ceil(cpu_quota), 1) + 1, MAX_NUM_WORKERS)
+
 
 def start_gunicorn_server(port: int, num_workers: int, debug: bool) -> None:
     """Starts a GUnicorn server locally."""
@@ -39,7 +64,7 @@ def entrypoint():
     # We can probably use asyncio since this service is going to be more I/O bound.
     parser = argparse.ArgumentParser(description="Hosted Inference Server")
     parser.add_argument("--port", type=int, default=5000)
-    parser.add_argument("--num-workers", type=int, default=4)
+    parser.add_argument("--num-workers", type=int, default=get_default_num_workers())
     parser.add_argument("--debug", "-d", action="store_true")
     args = parser.parse_args()
 
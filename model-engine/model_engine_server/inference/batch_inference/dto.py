@@ -20,7 +20,7 @@ class CompletionOutput(BaseModel):
 
 
 class CreateBatchCompletionsRequestContent(BaseModel):
-    prompts: List[str]
+    prompts: List[str] = Field(min_length=1)
     max_new_tokens: int
     temperature: float = Field(ge=0.0, le=1.0)
     """
@@ -392,7 +392,7 @@ async def batch_inference(config_file_data: Optional[str]):
 
         bar.close()
 
-    output_dicts = [output.dict() for output in outputs]
+    output_dicts = [output.model_dump() for output in outputs]
 
     if request.data_parallelism == 1:
         with smart_open.open(request.output_data_path, "w") as f:
@@ -1,16 +1,20 @@
 import ast
+import asyncio
 import json
 import os
+import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
+import aiohttp
+import orjson
 import requests
 import sseclient
 import yaml
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from model_engine_server.core.loggers import logger_name, make_logger
 from model_engine_server.inference.common import get_endpoint_config
 from model_engine_server.inference.infra.gateways.datadog_inference_monitoring_metrics_gateway import (
@@ -36,6 +40,8 @@ ENV_SERIALIZE_RESULTS_AS_STRING: str = "SERIALIZE_RESULTS_AS_STRING"
 
 DEFAULT_PORT: int = 5005
 
+_MAYBE_WIDE_INTEGER = re.compile(rb"\d{19}")
+
 
 class ModelEngineSerializationMixin:
     """Mixin class for optionally wrapping Model Engine requests."""
@@ -122,6 +128,27 @@ def parse_to_object_or_string(value: str) -> object:
         return value
 
 
+def _dumps_request_body(json_payload: Any) -> bytes:
+    # orjson refuses integers wider than 64 bits, which requests' json= serialized fine.
+    try:
+        return orjson.dumps(json_payload)
+    except TypeError:
+        return json.dumps(json_payload).encode("utf-8")
+
+
+def _loads_response_body(body: bytes) -> Any:
+    # Model servers may emit NaN/Infinity (e.g. in logprobs or scores), which orjson rejects but
+    # requests' .json() accepted, so fall back to the stdlib parser for those. orjson also parses
+    # integers wider than 64 bits into (lossy) floats rather than failing, so bodies that might
+    # hold one (any run of 19+ digits) go straight to the stdlib parser.
+    if _MAYBE_WIDE_INTEGER.search(body):
+        return json.loads(body)
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return json.loads(body)
+
+
 @dataclass
 class Forwarder(ModelEngineSerializationMixin):
     """Forwards inference requests to another service via HTTP POST.
@@ -143,6 +170,12 @@ class Forwarder(ModelEngineSerializationMixin):
     wrap_response: bool
     forward_http_status: bool
     post_inference_hooks_handler: PostInferenceHooksHandler
+    _session: Optional[aiohttp.ClientSession] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _session_loop: Optional[asyncio.AbstractEventLoop] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __call__(self, json_payload: Any) -> Any:
         json_payload, using_serialize_results_as_string = self.unwrap_json_payload(json_payload)
@@ -165,24 +198,74 @@ class Forwarder(ModelEngineSerializationMixin):
                 "from user-defined inference service."
             )
             raise
+        return self._handle_response(
+            response, response_raw.status_code, using_serialize_results_as_string
+        )
+
+    async def acall(self, json_payload: Any) -> Any:
+        """Same as calling the forwarder, but sends the request on a pooled aiohttp session."""
+        json_payload, using_serialize_results_as_string = self.unwrap_json_payload(json_payload)
+        json_payload_repr = json_payload.keys() if hasattr(json_payload, "keys") else json_payload
+
+        logger.info(f"Accepted request, forwarding {json_payload_repr=}")
+
+        try:
+            async with self._get_session().post(
+                self.predict_endpoint,
+                data=_dumps_request_body(json_payload),
+                headers={
+                    "Content-Type": "application/json",
+                },
+            ) as response_raw:
+                status_code = response_raw.status
+                # Parse the body regardless of its Content-Type, like requests' .json() does.
+                response = _loads_response_body(await response_raw.read())
+        except Exception:
+            logger.exception(
+                f"Failed to get response for request ({json_payload_repr}) "
+                "from user-defined inference service."
+            )
+            raise
+        return self._handle_response(response, status_code, using_serialize_results_as_string)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # A session is bound to the event loop it was created on, so create it lazily from the
+        # server's loop and reuse it (and its keep-alive connections) for every request after that.
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                # Concurrency is already bounded by the forwarder's concurrency limiter.
+                connector=aiohttp.TCPConnector(limit=0),
+                # Match requests, which doesn't time out waiting on the user-defined service.
+                timeout=aiohttp.ClientTimeout(total=None),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self) -> None:
+        """Closes the pooled aiohttp session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def _handle_response(
+        self, response: Any, status_code: int, using_serialize_results_as_string: bool
+    ) -> Any:
         if isinstance(response, dict):
             logger.info(
-                f"Got response from user-defined service: {response.keys()=}, {response_raw.status_code=}"
+                f"Got response from user-defined service: {response.keys()=}, {status_code=}"
             )
         elif isinstance(response, list):
-            logger.info(
-                f"Got response from user-defined service: {len(response)=}, {response_raw.status_code=}"
-            )
+            logger.info(f"Got response from user-defined service: {len(response)=}, {status_code=}")
         else:
-            logger.info(
-                f"Got response from user-defined service: {response=}, {response_raw.status_code=}"
-            )
+            logger.info(f"Got response from user-defined service: {response=}, {status_code=}")
 
         if self.wrap_response:
             response = self.get_response_payload(using_serialize_results_as_string, response)
 
         if self.forward_http_status:
-            return JSONResponse(content=response, status_code=response_raw.status_code)
+            return ORJSONResponse(content=response, status_code=status_code)
         else:
             return response
 
@@ -1,13 +1,14 @@
 import argparse
 import asyncio
 import os
-import signal
-from functools import lru_cache
+from contextlib import asynccontextmanager
 from typing import Any, Dict, Optional
 
 import orjson
 import uvicorn
-from fastapi import BackgroundTasks, Depends, FastAPI
+from fastapi import BackgroundTasks, Depends, FastAPI, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from model_engine_server.common.concurrency_limiter import MultiprocessingConcurrencyLimiter
 from model_engine_server.common.dtos.tasks import EndpointPredictV1Request
 from model_engine_server.core.loggers import logger_name, make_logger
@@ -18,10 +19,20 @@ from model_engine_server.inference.forwarding.forwarding import (
     StreamingForwarder,
     load_named_config,
 )
+from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
+from typing_extensions import Annotated
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore
 
 logger = make_logger(logger_name())
 
+# Probes hit the forwarder constantly, so serialize their body once rather than on every call.
+_HEALTHCHECK_BODY = orjson.dumps("OK")
+
 
 def get_config():
     overrides = os.getenv("CONFIG_OVERRIDES")
@@ -54,7 +65,6 @@ def get_streaming_forwarder_loader(destination_path: Optional[str] = None):
     return streaming_forwarder_loader
 
 
-@lru_cache()
 def get_concurrency_limiter():
     config = get_config()
     concurrency = int(config.get("max_concurrency", 100))
@@ -63,38 +73,84 @@ def get_concurrency_limiter():
     )
 
 
-@lru_cache()
 def load_forwarder(destination_path: Optional[str] = None):
     return get_forwarder_loader(destination_path).load(None, None)
 
 
-@lru_cache()
 def load_streaming_forwarder(destination_path: Optional[str] = None):
     return get_streaming_forwarder_loader(destination_path).load(None, None)
 
 
-def predict(
-    request: EndpointPredictV1Request,
+# The forwarders and the limiter are built once in init_app and kept on app.state. These
+# dependencies are async so that FastAPI doesn't hop to its threadpool to resolve them.
+async def get_app_forwarder(request: Request) -> Forwarder:
+    return request.app.state.forwarder
+
+
+async def get_app_streaming_forwarder(request: Request) -> StreamingForwarder:
+    if request.app.state.streaming_forwarder is None:
+        raise Exception("No streaming forwarder configured")
+    return request.app.state.streaming_forwarder
+
+
+async def get_app_concurrency_limiter(request: Request) -> MultiprocessingConcurrencyLimiter:
+    return request.app.state.concurrency_limiter
+
+
+def encode_sse_data(response: Any) -> bytes:
+    """
+    Frames a response as a single SSE data event. EventSourceResponse sends bytes as-is, and
+    orjson never emits raw newlines, so this skips the str round-trip and line splitting that
+    sse_starlette would otherwise do for every streamed chunk.
+    """
+    return b"data: " + orjson.dumps(response) + b"\r\n\r\n"
+
+
+async def parse_predict_request(request: Request) -> EndpointPredictV1Request:
+    """
+    Validates the raw request body in a single pass, rather than having FastAPI decode it to a dict
+    with the stdlib json module before pydantic validates that dict.
+    """
+    try:
+        return EndpointPredictV1Request.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        ) from exc
+
+
+async def predict(
+    request: Annotated[EndpointPredictV1Request, Depends(parse_predict_request)],
     background_tasks: BackgroundTasks,
-    forwarder=Depends(load_forwarder),
-    limiter=Depends(get_concurrency_limiter),
+    forwarder=Depends(get_app_forwarder),
+    limiter=Depends(get_app_concurrency_limiter),
 ):
+    # The limiter is created with fail_on_concurrency_limit=True, so entering it never blocks the
+    # event loop.
     with limiter:
         try:
-            response = forwarder(request.model_dump())
-            background_tasks.add_task(
-                forwarder.post_inference_hooks_handler.handle, request, response
-            )
-            return response
+            payload = request.model_dump()
+            response = await forwarder.acall(payload)
+            # Hooks are sync and run in the threadpool after the response is sent, so only
+            # schedule them when the endpoint actually has some.
+            if forwarder.post_inference_hooks_handler.has_hooks():
+                background_tasks.add_task(
+                    forwarder.post_inference_hooks_handler.handle, request, response
+                )
+            if isinstance(response, Response):
+                return response
+            # The body was just decoded by orjson, so it is plain JSON already; rendering it directly
+            # skips the jsonable_encoder walk FastAPI would do over the whole payload.
+            return ORJSONResponse(content=response)
         except Exception:
             logger.error(f"Failed to decode payload from: {request}")
             raise
 
 
 async def stream(
-    request: EndpointPredictV1Request,
-    forwarder=Depends(load_streaming_forwarder),
-    limiter=Depends(get_concurrency_limiter),
+    request: Annotated[EndpointPredictV1Request, Depends(parse_predict_request)],
+    forwarder=Depends(get_app_streaming_forwarder),
+    limiter=Depends(get_app_concurrency_limiter),
 ):
     with limiter:
         try:
@@ -103,13 +159,13 @@ async def stream(
             logger.error(f"Failed to decode payload from: {request}")
             raise
         else:
-            logger.debug(f"Received request: {payload}")
+            logger.debug("Received request: %s", payload)
 
         responses = forwarder(payload)
 
         async def event_generator():
             for response in responses:
-                yield {"data": orjson.dumps(response).decode("utf-8")}
+                yield encode_sse_data(response)
 
         return EventSourceResponse(event_generator())
 
@@ -127,46 +183,40 @@ async def serve_http(app: FastAPI, **uvicorn_kwargs: Any):  # pragma: no cover
 
     config = uvicorn.Config(app, **uvicorn_kwargs)
     server = uvicorn.Server(config)
-
-    loop = asyncio.get_running_loop()
-
-    server_task = loop.create_task(server.serve())
-
-    def signal_handler() -> None:
-        # prevents the uvicorn signal handler to exit early
-        server_task.cancel()
-
-    async def dummy_shutdown() -> None:
-        pass
-
-    loop.add_signal_handler(signal.SIGINT, signal_handler)
-    loop.add_signal_handler(signal.SIGTERM, signal_handler)
-
-    try:
-        await server_task
-        return dummy_shutdown()
-    except asyncio.CancelledError:
-        logger.info("Gracefully stopping http server")
-        return server.shutdown()
+    # uvicorn handles SIGINT/SIGTERM itself: it stops accepting connections, waits up to
+    # timeout_graceful_shutdown for in-flight requests, then runs the app's lifespan shutdown.
+    await server.serve()
 
 
 async def run_server(args, **uvicorn_kwargs) -> None:  # pragma: no cover
     app = await init_app()
-    shutdown_task = await serve_http(
+    await serve_http(
         app,
         host=args.host,
         port=args.port,
         **uvicorn_kwargs,
     )
 
-    await shutdown_task
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # In-flight requests have been drained by the time the lifespan exits, so the pooled
+    # connections to the user-defined service can be closed.
+    for forwarder in [app.state.forwarder, *app.state.extra_route_forwarders]:
+        await forwarder.aclose()
 
 
 async def init_app():
-    app = FastAPI()
+    app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+    app.state.forwarder = load_forwarder()
+    app.state.streaming_forwarder = load_streaming_forwarder() if "stream" in get_config() else None
+    app.state.concurrency_limiter = get_concurrency_limiter()
 
-    def healthcheck():
-        return "OK"
+    # Probes are served by plain Starlette routes, skipping FastAPI's request handling and
+    # the threadpool hop a sync endpoint would take.
+    async def healthcheck(request: Request) -> Response:
+        return Response(content=_HEALTHCHECK_BODY, media_type="application/json")
 
     def add_extra_routes(app: FastAPI):
         """Read extra_routes from config and dynamically add routes to app"""
@@ -177,30 +227,43 @@ async def init_app():
             sync_forwarders[route] = load_forwarder(route)
         for route in config.get("stream", {}).get("extra_routes", []):
             stream_forwarders[route] = load_streaming_forwarder(route)
+        app.state.extra_route_forwarders = list(sync_forwarders.values())
 
-        all_routes = set(list(sync_forwarders.keys()) + list(stream_forwarders.keys()))
+        def make_predict_or_stream(
+            sync_forwarder: Optional[Forwarder], stream_forwarder: Optional[StreamingForwarder]
+        ):
+            # The forwarders and the limiter are resolved once here rather than through
+            # per-request Depends, which also keeps each route bound to its own forwarders instead
+            # of the loop's last route.
+            limiter = app.state.concurrency_limiter
 
-        for route in all_routes:
-            # This route is a catch-all for any requests that don't match the /predict or /stream routes
-            # It will treat the request as a streaming request if the "stream" body parameter is set to true
-            # NOTE: it is important for this to be defined AFTER the /predict and /stream endpoints
-            # because FastAPI will match the first route that matches the request path
             async def predict_or_stream(
-                request: EndpointPredictV1Request,
+                request: Annotated[EndpointPredictV1Request, Depends(parse_predict_request)],
                 background_tasks: BackgroundTasks,
-                sync_forwarder=Depends(lambda: sync_forwarders.get(route)),
-                stream_forwarder=Depends(lambda: stream_forwarders.get(route)),
-                limiter=Depends(get_concurrency_limiter),
             ):
                 if not request.args:
                     raise Exception("Request has no args")
-                if request.args.root.get("stream", False) and stream_forwarder:
+                is_stream = request.args.root.get("stream", False)
+                if is_stream and stream_forwarder:
                     return await stream(request, stream_forwarder, limiter)
-                elif request.args.root.get("stream") is not True and sync_forwarder:
-                    return predict(request, background_tasks, sync_forwarder, limiter)
+                elif is_stream is not True and sync_forwarder:
+                    return await predict(request, background_tasks, sync_forwarder, limiter)
                 else:
                     raise Exception("No forwarder configured for this route")
 
+            return predict_or_stream
+
+        all_routes = sync_forwarders.keys() | stream_forwarders.keys()
+
+        for route in all_routes:
+            # This route is a catch-all for any requests that don't match the /predict or /stream routes
+            # It will treat the request as a streaming request if the "stream" body parameter is set to true
+            # NOTE: it is important for this to be defined AFTER the /predict and /stream endpoints
+            # because FastAPI will match the first route that matches the request path
+            predict_or_stream = make_predict_or_stream(
+                sync_forwarders.get(route), stream_forwarders.get(route)
+            )
+
             logger.info(f"Adding route {route}")
             app.add_api_route(
                 path=route,
@@ -208,8 +271,8 @@ async def init_app():
                 methods=["POST"],
             )
 
-    app.add_api_route(path="/healthz", endpoint=healthcheck, methods=["GET"])
-    app.add_api_route(path="/readyz", endpoint=healthcheck, methods=["GET"])
+    app.add_route(path="/healthz", route=healthcheck, methods=["GET"])
+    app.add_route(path="/readyz", route=healthcheck, methods=["GET"])
     app.add_api_route(path="/predict", endpoint=predict, methods=["POST"])
     app.add_api_route(path="/stream", endpoint=stream, methods=["POST"])
 
@@ -232,6 +295,11 @@ def entrypoint():  # pragma: no cover
     if args.set is not None:
         os.environ["CONFIG_OVERRIDES"] = ";".join(args.set)
 
+    # uvicorn only applies its own loop setting when it creates the event loop, which it doesn't
+    # when serve() is awaited from asyncio.run, so install uvloop ourselves if it's available.
+    if uvloop is not None:
+        uvloop.install()
+
     asyncio.run(
         run_server(
             args,
@@ -216,12 +216,17 @@ class PostInferenceHooksHandler:
                 else:
                     raise ValueError(f"Hook {hook_lower} is currently not supported.")
 
+    def has_hooks(self) -> bool:
+        return bool(self._hooks)
+
     def handle(
         self,
         request_payload: EndpointPredictV1Request,
         response: Union[Dict[str, Any], JSONResponse],
         task_id: Optional[str] = None,
     ):
+        if not self._hooks:
+            return
         if isinstance(response, JSONResponse):
             loaded_response = json.loads(response.body)
         else:
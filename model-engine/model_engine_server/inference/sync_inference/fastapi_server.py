@@ -38,7 +38,7 @@ predict_fn = load_predict_fn_or_cls()
 @app.get("/healthcheck")
 @app.get("/healthz")
 @app.get("/readyz")
-def healthcheck():
+async def healthcheck():
     return Response(status_code=status.HTTP_200_OK)
 
 
@@ -2,25 +2,40 @@ import asyncio
 import subprocess
 import sys
 import uuid
-from typing import Any, AsyncIterator, Coroutine, Tuple, Union
+from typing import Any, AsyncIterator, Coroutine, Optional, Tuple, Union
 
 from typing_extensions import TypeVar
 
+CGROUP_V2_CPU_MAX_PATH = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA_PATH = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD_PATH = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
 
-def get_cpu_cores_in_container() -> int:
-    import multiprocessing
 
-    cpu_count = multiprocessing.cpu_count()
+def get_container_cpu_quota() -> Optional[float]:
+    """Returns the container's CPU limit in cores from cgroup v2 or v1, or None if it has none."""
+    try:
+        with open(CGROUP_V2_CPU_MAX_PATH) as fp:
+            quota, period = fp.read().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (FileNotFoundError, ValueError):
+        pass
     try:
-        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as fp:
+        with open(CGROUP_V1_CPU_QUOTA_PATH) as fp:
             cfs_quota_us = int(fp.read())
-        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as fp:
+        with open(CGROUP_V1_CPU_PERIOD_PATH) as fp:
             cfs_period_us = int(fp.read())
-        if cfs_quota_us != -1:
-            cpu_count = cfs_quota_us // cfs_period_us
-    except FileNotFoundError:
-        pass
-    return cpu_count
+        return None if cfs_quota_us <= 0 else cfs_quota_us / cfs_period_us
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def get_cpu_cores_in_container() -> int:
+    import multiprocessing
+
+    cpu_quota = get_container_cpu_quota()
+    if cpu_quota is None:
+        return multiprocessing.cpu_count()
+    return int(cpu_quota)
 
 
 def get_gpu_free_memory():  # pragma: no cover
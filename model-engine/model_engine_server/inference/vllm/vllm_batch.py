@@ -18,12 +18,13 @@ from typing import (
 import smart_open
 from fastapi import Request
 from model_engine_server.common.dtos.llms import (
-    BatchCompletionContent,
+    BatchCompletionContentTypeAdapter,
     BatchCompletionsModelConfig,
     CompletionResponse,
     CompletionV1Output,
     CreateBatchCompletionsEngineRequest,
     CreateBatchCompletionsV1RequestContent,
+    FilteredChatCompletionV2Request,
     TokenOutput,
     VLLMModelConfig,
 )
@@ -68,6 +69,11 @@ _BatchCompletionContent: TypeAlias = Union[
     List[ChatCompletionRequest],
 ]
 
+# Built once, and picked by the type of the parsed content, so that the recast below is a single
+# validation pass rather than trying each list type of a union in turn.
+_COMPLETION_REQUESTS_TYPE_ADAPTER = TypeAdapter(List[CompletionRequest])
+_CHAT_COMPLETION_REQUESTS_TYPE_ADAPTER = TypeAdapter(List[ChatCompletionRequest])
+
 
 async def dummy_receive() -> MutableMapping[str, Any]:
     return {"type": "continue"}
@@ -290,15 +296,17 @@ def load_batch_content(
     content = request.content
     if content is None:
         with smart_open.open(request.input_data_path, "r") as f:
-            data = json.load(f)
-            content = TypeAdapter(BatchCompletionContent).validate_python(data)
+            content = BatchCompletionContentTypeAdapter.validate_json(f.read())
 
     # Recast the content to vLLMs schema
     if isinstance(content, List) and len(content) > 0:
         model = get_model_name(request.model_cfg)
-        return TypeAdapter(
-            Union[List[CompletionRequest], List[ChatCompletionRequest]]
-        ).validate_python(
+        type_adapter: TypeAdapter = (
+            _CHAT_COMPLETION_REQUESTS_TYPE_ADAPTER
+            if isinstance(content[0], FilteredChatCompletionV2Request)
+            else _COMPLETION_REQUESTS_TYPE_ADAPTER
+        )
+        return type_adapter.validate_python(
             [
                 overwrite_request(req.model_dump(exclude_none=True, mode="json"), model)
                 for req in content
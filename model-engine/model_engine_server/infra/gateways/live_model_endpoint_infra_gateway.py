@@ -104,7 +104,7 @@ class LiveModelEndpointInfraGateway(ModelEndpointInfraGateway):
             task_name=BUILD_TASK_NAME,
             queue_name=get_service_builder_queue(SERVICE_IDENTIFIER),
             # celery request is required to be JSON serializables
-            kwargs=dict(build_endpoint_request_json=build_endpoint_request.dict()),
+            kwargs=dict(build_endpoint_request_json=build_endpoint_request.model_dump()),
         )
         return response.task_id
 
@@ -214,7 +214,7 @@ class LiveModelEndpointInfraGateway(ModelEndpointInfraGateway):
         response = self.task_queue_gateway.send_task(
             task_name=BUILD_TASK_NAME,
             queue_name=get_service_builder_queue(SERVICE_IDENTIFIER),
-            kwargs=dict(build_endpoint_request_json=build_endpoint_request.dict()),
+            kwargs=dict(build_endpoint_request_json=build_endpoint_request.model_dump()),
         )
         return response.task_id
 
@@ -30,6 +30,14 @@ from starlette.routing import BaseRoute
 
 # Caches the default model definition so we don't need to recompute every time
 _default_model_definitions = None
+# Same for the predict request/response models shared by every endpoint, keyed by class name
+_predict_model_definitions = None
+
+_PREDICT_MODELS: List[Type[pydantic.BaseModel]] = [
+    EndpointPredictV1Request,
+    GetAsyncTaskV1Response,
+    SyncEndpointPredictV1Response,
+]
 
 API_REFERENCE_TITLE = "Launch Endpoints API Reference"
 API_REFERENCE_VERSION = "1.0.0"
@@ -164,16 +172,14 @@ class LiveModelEndpointsSchemaGateway(ModelEndpointsSchemaGateway):
         Returns:
             Dict[str, Any]: The updated model definitions.
         """
-        models: List[Type[pydantic.BaseModel]] = [
-            EndpointPredictV1Request,
-            GetAsyncTaskV1Response,
-            SyncEndpointPredictV1Response,
-        ]
-
+        # The generated schemas only reference the models by class name, so just the top level
+        # names need the prefix.
         model_name_map = LiveModelEndpointsSchemaGateway.get_model_name_map(prefix)
-        definitions: Dict[str, Any] = LiveModelEndpointsSchemaGateway.get_model_definitions(
-            models=models, model_name_map=model_name_map
+        definitions: Dict[str, Any] = dict(
+            LiveModelEndpointsSchemaGateway.get_predict_model_definitions()
         )
+        for model in _PREDICT_MODELS:
+            definitions[model_name_map[model]] = definitions.pop(model.__name__)
 
         user_definitions = {}
         for k, v in model_definitions.items():
@@ -252,6 +258,17 @@ class LiveModelEndpointsSchemaGateway(ModelEndpointsSchemaGateway):
 
         return _default_model_definitions
 
+    @staticmethod
+    def get_predict_model_definitions() -> Dict[str, Any]:
+        global _predict_model_definitions
+
+        if _predict_model_definitions is None:
+            _predict_model_definitions = LiveModelEndpointsSchemaGateway.get_model_definitions(
+                models=_PREDICT_MODELS, model_name_map={}
+            )
+
+        return _predict_model_definitions
+
     @staticmethod
     def get_model_definitions(
         models: Sequence[Type[pydantic.BaseModel]],
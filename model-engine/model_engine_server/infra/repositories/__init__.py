@@ -16,8 +16,12 @@ from .live_tokenizer_repository import LiveTokenizerRepository
 from .llm_fine_tune_repository import LLMFineTuneRepository
 from .model_endpoint_cache_repository import ModelEndpointCacheRepository
 from .model_endpoint_record_repository import ModelEndpointRecordRepository
+from .model_endpoint_response_cache_repository import ModelEndpointResponseCacheRepository
 from .redis_feature_flag_repository import RedisFeatureFlagRepository
 from .redis_model_endpoint_cache_repository import RedisModelEndpointCacheRepository
+from .redis_model_endpoint_response_cache_repository import (
+    RedisModelEndpointResponseCacheRepository,
+)
 from .s3_file_llm_fine_tune_events_repository import S3FileLLMFineTuneEventsRepository
 from .s3_file_llm_fine_tune_repository import S3FileLLMFineTuneRepository
 
@@ -38,8 +42,10 @@ __all__: Sequence[str] = [
     "LLMFineTuneRepository",
     "ModelEndpointRecordRepository",
     "ModelEndpointCacheRepository",
+    "ModelEndpointResponseCacheRepository",
     "RedisFeatureFlagRepository",
     "RedisModelEndpointCacheRepository",
+    "RedisModelEndpointResponseCacheRepository",
     "S3FileLLMFineTuneRepository",
     "S3FileLLMFineTuneEventsRepository",
 ]
@@ -185,7 +185,7 @@ def translate_kwargs_to_model_bundle_orm(
     app_config: Optional[Dict[str, Any]],
 ) -> OrmModelBundle:
     kwargs = locals()
-    flavor_dict = flavor.dict()
+    flavor_dict = flavor.model_dump()
     framework_dict = flavor_dict.get("framework", {})
     return OrmModelBundle(
         name=name,
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 from model_engine_server.domain.entities import ModelEndpointInfraState
 
@@ -37,3 +37,18 @@ class ModelEndpointCacheRepository(ABC):
             ModelEndpointInfraState if it's available in the cache
         """
         pass
+
+    @abstractmethod
+    async def read_endpoint_infos(
+        self, endpoint_ids_and_deployment_names: Sequence[Tuple[str, str]]
+    ) -> List[Optional[ModelEndpointInfraState]]:
+        """
+        Reads the endpoint info of several endpoints from the cache in as few round trips as possible
+        Args:
+            endpoint_ids_and_deployment_names: (endpoint_id, deployment_name) pairs, as would be
+                passed to read_endpoint_info
+
+        Returns:
+            For each pair, in order, ModelEndpointInfraState if it's available in the cache
+        """
+        pass
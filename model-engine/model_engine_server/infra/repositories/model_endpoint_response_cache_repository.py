@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class ModelEndpointResponseCacheRepository(ABC):
+    @abstractmethod
+    async def write_model_endpoint_response(
+        self,
+        model_endpoint_id: str,
+        owner: str,
+        response: bytes,
+        ttl_seconds: float,
+        generation: int,
+    ):
+        """
+        Writes a serialized GET /model-endpoints/{id} response to the cache, unless the endpoint
+        was invalidated since the response was rendered
+        Args:
+            model_endpoint_id: The ID of the endpoint.
+            owner: The team the response was rendered for.
+            response: The JSON-serialized response body.
+            ttl_seconds: TTL on the cache entry
+            generation: The generation returned by the read that preceded rendering the response.
+                The write is dropped if the endpoint's generation has changed since.
+        Returns:
+            None
+        """
+        pass
+
+    @abstractmethod
+    async def read_model_endpoint_response(
+        self, model_endpoint_id: str, owner: str
+    ) -> Tuple[Optional[bytes], int]:
+        """
+        Reads a serialized GET /model-endpoints/{id} response from the cache
+        Args:
+            model_endpoint_id: The ID of the endpoint.
+            owner: The team the response was rendered for.
+
+        Returns:
+            The JSON-serialized response body if it's available in the cache, and the endpoint's
+            current generation, to pass to write_model_endpoint_response on a miss
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate_model_endpoint(self, model_endpoint_id: str):
+        """
+        Drops every cached response for the endpoint and bumps its generation, e.g. after it was
+        updated or deleted, so that responses rendered before then are not cached afterwards
+        Args:
+            model_endpoint_id: The ID of the endpoint.
+        Returns:
+            None
+        """
+        pass
@@ -1,6 +1,5 @@
-import json
 import os
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 import aioredis
 from model_engine_server.domain.entities import ModelEndpointInfraState
@@ -47,8 +46,7 @@ class RedisModelEndpointCacheRepository(ModelEndpointCacheRepository):
         ttl_seconds: float,
     ):
         key = self._find_redis_key(endpoint_id or endpoint_info.deployment_name)
-        endpoint_info_str = json.dumps(endpoint_info.dict())
-        await self._redis.set(key, endpoint_info_str, ex=ttl_seconds)
+        await self._redis.set(key, endpoint_info.model_dump_json(), ex=ttl_seconds)
 
     async def read_endpoint_info(
         self, endpoint_id: str, deployment_name: str
@@ -61,4 +59,28 @@ class RedisModelEndpointCacheRepository(ModelEndpointCacheRepository):
             info = await self._redis.get(deployment_name_key)
             if info is None:
                 return None
-        return ModelEndpointInfraState(**json.loads(info))
+        return ModelEndpointInfraState.model_validate_json(info)
+
+    async def read_endpoint_infos(
+        self, endpoint_ids_and_deployment_names: Sequence[Tuple[str, str]]
+    ) -> List[Optional[ModelEndpointInfraState]]:
+        if not endpoint_ids_and_deployment_names:
+            return []
+        infos = await self._redis.mget(
+            [
+                self._find_redis_key(endpoint_id)
+                for endpoint_id, _ in endpoint_ids_and_deployment_names
+            ]
+        )
+        missing = [i for i, info in enumerate(infos) if info is None]
+        if missing:
+            # Fall back to the deprecated deployment name keys in a single extra round trip.
+            fallback_infos = await self._redis.mget(
+                [self._find_redis_key(endpoint_ids_and_deployment_names[i][1]) for i in missing]
+            )
+            for i, info in zip(missing, fallback_infos):
+                infos[i] = info
+        return [
+            None if info is None else ModelEndpointInfraState.model_validate_json(info)
+            for info in infos
+        ]
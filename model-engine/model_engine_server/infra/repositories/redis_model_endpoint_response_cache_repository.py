@@ -0,0 +1,96 @@
+import os
+from typing import Optional, Tuple
+
+import aioredis
+from model_engine_server.infra.repositories.model_endpoint_response_cache_repository import (
+    ModelEndpointResponseCacheRepository,
+)
+
+SERVICE_IDENTIFIER = os.getenv("SERVICE_IDENTIFIER")
+# Only has to outlive a single GET's read-render-write; refreshed on every invalidation.
+GENERATION_TTL_SECONDS = 24 * 60 * 60
+
+
+class RedisModelEndpointResponseCacheRepository(ModelEndpointResponseCacheRepository):
+    """
+    Stores one Redis hash per endpoint, keyed by owner, so that an update or delete can drop every
+    cached rendering of the endpoint with a single DEL.
+
+    Each endpoint also has a generation counter that invalidation bumps. A cache-aside write only
+    goes through (under WATCH) if the generation is still the one read before the response was
+    rendered, so a GET racing an update or delete can't re-cache what it read before the change.
+    """
+
+    def __init__(
+        self,
+        redis_info: Optional[str] = None,
+        redis_client: Optional[aioredis.Redis] = None,
+    ):
+        assert redis_info or redis_client, "Either redis_info or redis_client must be defined."
+        if redis_info:
+            # If aioredis cannot create a connection pool, reraise that as an error because the
+            # default error message is cryptic and not obvious.
+            try:
+                self._redis = aioredis.from_url(redis_info, health_check_interval=60)
+            except Exception as exc:
+                raise RuntimeError(
+                    "If redis_info is specified, RedisModelEndpointResponseCacheRepository must be"
+                    "initialized within a coroutine. Please specify the redis_client directly."
+                ) from exc
+        else:
+            assert redis_client is not None  # for mypy
+            self._redis = redis_client
+
+    @staticmethod
+    def _find_redis_key(model_endpoint_id: str):
+        if SERVICE_IDENTIFIER:
+            return f"launch-response-cache:{SERVICE_IDENTIFIER}:model-endpoint:{model_endpoint_id}"
+        else:
+            return f"launch-response-cache:model-endpoint:{model_endpoint_id}"
+
+    @classmethod
+    def _find_generation_redis_key(cls, model_endpoint_id: str):
+        return f"{cls._find_redis_key(model_endpoint_id)}:generation"
+
+    async def write_model_endpoint_response(
+        self,
+        model_endpoint_id: str,
+        owner: str,
+        response: bytes,
+        ttl_seconds: float,
+        generation: int,
+    ):
+        key = self._find_redis_key(model_endpoint_id)
+        generation_key = self._find_generation_redis_key(model_endpoint_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                await pipe.watch(generation_key)
+                if int(await pipe.get(generation_key) or 0) != generation:
+                    return
+                # Sent as one MULTI/EXEC so the hash can never be left behind without a TTL.
+                pipe.multi()
+                await pipe.hset(key, owner, response).expire(key, int(ttl_seconds)).execute()
+        except aioredis.WatchError:
+            # Invalidated while writing, so the response may already be stale.
+            pass
+
+    async def read_model_endpoint_response(
+        self, model_endpoint_id: str, owner: str
+    ) -> Tuple[Optional[bytes], int]:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            response, generation = (
+                await pipe.hget(self._find_redis_key(model_endpoint_id), owner)
+                .get(self._find_generation_redis_key(model_endpoint_id))
+                .execute()
+            )
+        return response, int(generation or 0)
+
+    async def invalidate_model_endpoint(self, model_endpoint_id: str):
+        generation_key = self._find_generation_redis_key(model_endpoint_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            await (
+                pipe.incr(generation_key)
+                .expire(generation_key, GENERATION_TTL_SECONDS)
+                .delete(self._find_redis_key(model_endpoint_id))
+                .execute()
+            )
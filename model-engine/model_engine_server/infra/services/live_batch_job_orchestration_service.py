@@ -67,7 +67,7 @@ class BatchEndpointInferencePredictionResponse:
     reference_id: Optional[str]
 
     def json(self):
-        response_dict = self.response.dict()
+        response_dict = self.response.model_dump()
         response_dict["id"] = self.reference_id
         return json.dumps(response_dict)
 
@@ -58,6 +58,7 @@ from model_engine_server.infra.infra_utils import make_exception_log
 from model_engine_server.infra.repositories import (
     FeatureFlagRepository,
     ModelEndpointCacheRepository,
+    ModelEndpointResponseCacheRepository,
 )
 from model_engine_server.infra.repositories.model_endpoint_record_repository import (
     ModelEndpointRecordRepository,
@@ -121,6 +122,9 @@ class LiveEndpointBuilderService(EndpointBuilderService):
         filesystem_gateway: FilesystemGateway,
         notification_gateway: NotificationGateway,
         feature_flag_repo: FeatureFlagRepository,
+        model_endpoint_response_cache_repository: Optional[
+            ModelEndpointResponseCacheRepository
+        ] = None,
     ) -> None:
         self.docker_repository = docker_repository
         self.resource_gateway = resource_gateway
@@ -130,6 +134,18 @@ class LiveEndpointBuilderService(EndpointBuilderService):
         self.filesystem_gateway = filesystem_gateway
         self.notification_gateway = notification_gateway
         self.feature_flag_repo = feature_flag_repo
+        self.model_endpoint_response_cache_repository = model_endpoint_response_cache_repository
+
+    async def _update_model_endpoint_record(self, model_endpoint_id: str, **kwargs) -> None:
+        await self.model_endpoint_record_repository.update_model_endpoint_record(
+            model_endpoint_id=model_endpoint_id, **kwargs
+        )
+        # Clients poll GET /model-endpoints/{id} for the build status, so don't let a cached
+        # response hold back the new one.
+        if self.model_endpoint_response_cache_repository is not None:
+            await self.model_endpoint_response_cache_repository.invalidate_model_endpoint(
+                model_endpoint_id=model_endpoint_id
+            )
 
     async def build_endpoint(
         self, build_endpoint_request: BuildEndpointRequest
@@ -137,7 +153,7 @@ class LiveEndpointBuilderService(EndpointBuilderService):
         time_build_endpoint_start = time.time()
         self.monitoring_metrics_gateway.emit_attempted_build_metric()
 
-        logger_extra = build_endpoint_request.dict()
+        logger_extra = build_endpoint_request.model_dump()
         logger_adapter = LoggerAdapter(logger, extra=logger_extra)
         log_error = make_exception_log(logger_adapter)
 
@@ -260,7 +276,7 @@ class LiveEndpointBuilderService(EndpointBuilderService):
                 # Because this update is not the final update in the lock, the 'update_in_progress'
                 # value isn't really necessary for correctness in not having races, but it's still
                 # informative at the least
-                await self.model_endpoint_record_repository.update_model_endpoint_record(
+                await self._update_model_endpoint_record(
                     model_endpoint_id=endpoint_id,
                     status=ModelEndpointStatus.UPDATE_IN_PROGRESS,
                 )
@@ -338,7 +354,7 @@ class LiveEndpointBuilderService(EndpointBuilderService):
                     ttl_seconds=INITIAL_K8S_CACHE_TTL_SECONDS,
                 )
 
-                await self.model_endpoint_record_repository.update_model_endpoint_record(
+                await self._update_model_endpoint_record(
                     model_endpoint_id=endpoint_id,
                     destination=create_or_update_response.destination,
                     status=ModelEndpointStatus.READY,
@@ -348,7 +364,7 @@ class LiveEndpointBuilderService(EndpointBuilderService):
                 log_error("Failed endpoint build process!")
                 # Update status as failed endpoint creation on unhandled error
                 try:
-                    await self.model_endpoint_record_repository.update_model_endpoint_record(
+                    await self._update_model_endpoint_record(
                         model_endpoint_id=endpoint_id,
                         status=ModelEndpointStatus.UPDATE_FAILED,
                     )
@@ -717,7 +733,7 @@ class LiveEndpointBuilderService(EndpointBuilderService):
                         f"Image build failed for endpoint {model_endpoint_name}, user {user_id}"
                     )
 
-                    await self.model_endpoint_record_repository.update_model_endpoint_record(
+                    await self._update_model_endpoint_record(
                         model_endpoint_id=build_endpoint_request.model_endpoint_record.id,
                         status=ModelEndpointStatus.UPDATE_FAILED,
                     )
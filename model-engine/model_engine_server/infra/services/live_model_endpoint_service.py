@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional
+import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from datadog import statsd
 from model_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
@@ -19,6 +20,7 @@ from model_engine_server.domain.entities import (
 from model_engine_server.domain.exceptions import (
     EndpointDeleteFailedException,
     ObjectAlreadyExistsException,
+    ObjectHasInvalidValueException,
     ObjectNotFoundException,
 )
 from model_engine_server.domain.gateways import (
@@ -33,7 +35,10 @@ from model_engine_server.domain.gateways.inference_autoscaling_metrics_gateway i
 from model_engine_server.domain.services import ModelEndpointService
 from model_engine_server.domain.use_cases.model_endpoint_use_cases import MODEL_BUNDLE_CHANGED_KEY
 from model_engine_server.infra.gateways import ModelEndpointInfraGateway
-from model_engine_server.infra.repositories import ModelEndpointCacheRepository
+from model_engine_server.infra.repositories import (
+    ModelEndpointCacheRepository,
+    ModelEndpointResponseCacheRepository,
+)
 from model_engine_server.infra.repositories.model_endpoint_record_repository import (
     ModelEndpointRecordRepository,
 )
@@ -44,6 +49,44 @@ STATSD_CACHE_HIT_NAME = "launch.get_infra_state.cache_hit"
 STATSD_CACHE_MISS_NAME = "launch.get_infra_state.cache_miss"
 
 
+def _as_utc(timestamp: datetime.datetime) -> datetime.datetime:
+    # Naive timestamps are stored as UTC; aware and naive datetimes can't be compared directly.
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp.astimezone(datetime.timezone.utc)
+
+
+def paginate_model_endpoint_records(
+    records: List[ModelEndpointRecord],
+    order_by: Optional[ModelEndpointOrderBy],
+    limit: Optional[int],
+    after: Optional[Tuple[datetime.datetime, str]],
+) -> List[ModelEndpointRecord]:
+    """
+    Keyset-paginates records on (created_at, id), which stays stable when endpoints are created or
+    deleted between pages. Alphabetical order has no such key, so it can't be paginated.
+    """
+    if order_by == ModelEndpointOrderBy.ALPHABETICAL:
+        raise ObjectHasInvalidValueException(
+            "Paginating model endpoints is only supported when ordering by newest or oldest."
+        )
+
+    def key(record: ModelEndpointRecord) -> Tuple[datetime.datetime, str]:
+        return _as_utc(record.created_at), record.id
+
+    reverse = order_by != ModelEndpointOrderBy.OLDEST
+    records = sorted(records, key=key, reverse=reverse)
+    if after is not None:
+        after = _as_utc(after[0]), after[1]
+        if reverse:
+            records = [r for r in records if key(r) < after]
+        else:
+            records = [r for r in records if key(r) > after]
+    if limit is not None:
+        records = records[:limit]
+    return records
+
+
 class LiveModelEndpointService(ModelEndpointService):
     def __init__(
         self,
@@ -55,6 +98,9 @@ class LiveModelEndpointService(ModelEndpointService):
         sync_model_endpoint_inference_gateway: SyncModelEndpointInferenceGateway,
         model_endpoints_schema_gateway: ModelEndpointsSchemaGateway,
         inference_autoscaling_metrics_gateway: InferenceAutoscalingMetricsGateway,
+        model_endpoint_response_cache_repository: Optional[
+            ModelEndpointResponseCacheRepository
+        ] = None,
     ):
         self.model_endpoint_record_repository = model_endpoint_record_repository
         self.model_endpoint_infra_gateway = model_endpoint_infra_gateway
@@ -64,6 +110,7 @@ class LiveModelEndpointService(ModelEndpointService):
         self.sync_model_endpoint_inference_gateway = sync_model_endpoint_inference_gateway
         self.model_endpoints_schema_gateway = model_endpoints_schema_gateway
         self.inference_autoscaling_metrics_gateway = inference_autoscaling_metrics_gateway
+        self.model_endpoint_response_cache_repository = model_endpoint_response_cache_repository
 
     def get_async_model_endpoint_inference_gateway(
         self,
@@ -85,6 +132,53 @@ class LiveModelEndpointService(ModelEndpointService):
     ) -> InferenceAutoscalingMetricsGateway:
         return self.inference_autoscaling_metrics_gateway
 
+    async def _invalidate_model_endpoint_responses(self, model_endpoint_id: str) -> None:
+        # Both the v1 and the LLM update/delete routes go through the service, so the cached
+        # GET /model-endpoints/{id} responses are dropped here rather than in each route. The
+        # endpoint builder invalidates after its own status writes; infra state (e.g. replica
+        # counts) changes without a record write and may be up to the cache TTL stale.
+        if self.model_endpoint_response_cache_repository is not None:
+            await self.model_endpoint_response_cache_repository.invalidate_model_endpoint(
+                model_endpoint_id=model_endpoint_id
+            )
+
+    def _record_cache_lookup(
+        self,
+        record: ModelEndpointRecord,
+        deployment_name: str,
+        state: Optional[ModelEndpointInfraState],
+    ) -> None:
+        tags = [
+            f"endpoint_name:{record.name}",
+            f"user_id:{record.created_by}",
+            f"team_id:{record.owner}",
+        ]
+        if state is None:
+            statsd.increment(STATSD_CACHE_MISS_NAME, 1, tags=tags)
+            logger.warning(
+                f"Cache miss, reading directly from k8s for {deployment_name}",
+                extra={
+                    "endpoint_name": record.name,
+                    "endpoint_id": record.id,
+                    "user_id": record.created_by,
+                    "team_id": record.owner,
+                },
+            )
+        else:
+            statsd.increment(STATSD_CACHE_HIT_NAME, 1, tags=tags)
+
+    async def _get_model_endpoint_infra_state_from_k8s(
+        self, record: ModelEndpointRecord
+    ) -> Optional[ModelEndpointInfraState]:
+        state = await self.model_endpoint_infra_gateway.get_model_endpoint_infra(
+            model_endpoint_record=record
+        )
+        if state is not None:
+            await self.model_endpoint_cache_repository.write_endpoint_info(
+                endpoint_id=record.id, endpoint_info=state, ttl_seconds=60
+            )
+        return state
+
     async def _get_model_endpoint_infra_state(
         self, record: ModelEndpointRecord, use_cache: bool
     ) -> Optional[ModelEndpointInfraState]:
@@ -103,34 +197,30 @@ class LiveModelEndpointService(ModelEndpointService):
             state = await self.model_endpoint_cache_repository.read_endpoint_info(
                 endpoint_id=record.id, deployment_name=deployment_name
             )
-            tags = [
-                f"endpoint_name:{record.name}",
-                f"user_id:{record.created_by}",
-                f"team_id:{record.owner}",
-            ]
-            if state is None:
-                statsd.increment(STATSD_CACHE_MISS_NAME, 1, tags=tags)
-                logger.warning(
-                    f"Cache miss, reading directly from k8s for {deployment_name}",
-                    extra={
-                        "endpoint_name": record.name,
-                        "endpoint_id": record.id,
-                        "user_id": record.created_by,
-                        "team_id": record.owner,
-                    },
-                )
-            else:
-                statsd.increment(STATSD_CACHE_HIT_NAME, 1, tags=tags)
+            self._record_cache_lookup(record, deployment_name, state)
         if state is None:
-            state = await self.model_endpoint_infra_gateway.get_model_endpoint_infra(
-                model_endpoint_record=record
-            )
-            if state is not None:
-                await self.model_endpoint_cache_repository.write_endpoint_info(
-                    endpoint_id=record.id, endpoint_info=state, ttl_seconds=60
-                )
+            state = await self._get_model_endpoint_infra_state_from_k8s(record)
         return state
 
+    async def _get_model_endpoint_infra_states(
+        self, records: List[ModelEndpointRecord]
+    ) -> List[Optional[ModelEndpointInfraState]]:
+        """
+        Gets state of model endpoint infra for several records, reading the cache for all of them
+        at once and only going to k8s for the misses.
+        """
+        deployment_names = [
+            generate_deployment_name(record.created_by, record.name) for record in records
+        ]
+        states = await self.model_endpoint_cache_repository.read_endpoint_infos(
+            list(zip([record.id for record in records], deployment_names))
+        )
+        for i, (record, deployment_name) in enumerate(zip(records, deployment_names)):
+            self._record_cache_lookup(record, deployment_name, states[i])
+            if states[i] is None:
+                states[i] = await self._get_model_endpoint_infra_state_from_k8s(record)
+        return states
+
     async def create_model_endpoint(
         self,
         *,
@@ -249,16 +339,21 @@ class LiveModelEndpointService(ModelEndpointService):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime.datetime, str]] = None,
     ) -> List[ModelEndpoint]:
         # Will read from cache at first
         records = await self.model_endpoint_record_repository.list_model_endpoint_records(
             owner=owner, name=name, order_by=order_by
         )
-        endpoints: List[ModelEndpoint] = []
-        for record in records:
-            infra_state = await self._get_model_endpoint_infra_state(record=record, use_cache=True)
-            endpoints.append(ModelEndpoint(record=record, infra_state=infra_state))
-        return endpoints
+        # Paginate before looking up infra state, which is the expensive part per endpoint.
+        if limit is not None or after is not None:
+            records = paginate_model_endpoint_records(records, order_by, limit, after)
+        infra_states = await self._get_model_endpoint_infra_states(records)
+        return [
+            ModelEndpoint(record=record, infra_state=infra_state)
+            for record, infra_state in zip(records, infra_states)
+        ]
 
     async def update_model_endpoint(
         self,
@@ -354,6 +449,8 @@ class LiveModelEndpointService(ModelEndpointService):
                 metadata=metadata,
             )
 
+        await self._invalidate_model_endpoint_responses(model_endpoint_id)
+
         record = await self.model_endpoint_record_repository.get_model_endpoint_record(
             model_endpoint_id=model_endpoint_id
         )
@@ -397,4 +494,6 @@ class LiveModelEndpointService(ModelEndpointService):
                 model_endpoint_id=model_endpoint_id
             )
 
+        await self._invalidate_model_endpoint_responses(model_endpoint_id)
+
         logger.info(f"Endpoint delete released lock for {created_by}, {name}")
@@ -47,6 +47,7 @@ from model_engine_server.infra.repositories import (
     FakeDockerRepository,
     RedisFeatureFlagRepository,
     RedisModelEndpointCacheRepository,
+    RedisModelEndpointResponseCacheRepository,
 )
 from model_engine_server.infra.services import LiveEndpointBuilderService
 from model_engine_server.service_builder.celery import service_builder_service
@@ -101,6 +102,9 @@ def get_live_endpoint_builder_service(
         ),
         notification_gateway=notification_gateway,
         feature_flag_repo=RedisFeatureFlagRepository(redis_client=redis),
+        model_endpoint_response_cache_repository=RedisModelEndpointResponseCacheRepository(
+            redis_client=redis
+        ),
     )
 
     return service
@@ -133,4 +137,4 @@ def build_endpoint(build_endpoint_request_json: Dict[str, Any]) -> Dict[str, str
         build_endpoint_request_json
     )
     result = asyncio.run(_build_endpoint(build_endpoint_request))
-    return result.dict()
+    return result.model_dump()
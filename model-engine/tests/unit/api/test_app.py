@@ -1,4 +1,7 @@
+from unittest import mock
+
 from fastapi.testclient import TestClient
+from model_engine_server.api.app import app, warm_openapi_schema
 
 
 def test_healthcheck(simple_client: TestClient):
@@ -10,3 +13,9 @@ def test_healthcheck(simple_client: TestClient):
 
     response = simple_client.get("/readyz")
     assert response.status_code == 200
+
+
+def test_warm_openapi_schema_failure_does_not_raise():
+    with mock.patch.object(app, "openapi", side_effect=ValueError("bad schema")) as openapi:
+        warm_openapi_schema()
+    openapi.assert_called_once()
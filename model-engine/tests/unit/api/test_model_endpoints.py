@@ -41,6 +41,29 @@ def test_create_model_endpoint_success(
     assert response_2.status_code == 200
 
 
+def test_create_model_endpoint_malformed_json_returns_422(
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    client = get_test_client_wrapper(
+        fake_docker_repository_image_always_exists=True,
+        fake_model_bundle_repository_contents={},
+        fake_model_endpoint_record_repository_contents={},
+        fake_model_endpoint_infra_gateway_contents={},
+        fake_batch_job_record_repository_contents={},
+        fake_batch_job_progress_gateway_contents={},
+        fake_docker_image_batch_job_bundle_repository_contents={},
+    )
+    response = client.post(
+        "/v1/model-endpoints",
+        auth=(test_api_key, ""),
+        content=b'{"name": ',
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
 def test_create_model_endpoint_invalid_team_returns_400(
     model_bundle_1_v1: Tuple[ModelBundle, Any],
     create_model_endpoint_request_sync: Dict[str, Any],
@@ -264,7 +287,8 @@ def test_list_model_endpoints(
     )
     assert response_1.status_code == 200
     assert response_1.json() == {
-        "model_endpoints": [expected_model_endpoint_1, expected_model_endpoint_2]
+        "model_endpoints": [expected_model_endpoint_1, expected_model_endpoint_2],
+        "next_cursor": None,
     }
 
     response_2 = client.get(
@@ -272,7 +296,58 @@ def test_list_model_endpoints(
         auth=(test_api_key_2, ""),
     )
     assert response_2.status_code == 200
-    assert response_2.json() == {"model_endpoints": []}
+    assert response_2.json() == {"model_endpoints": [], "next_cursor": None}
+
+
+def test_list_model_endpoints_paginated(
+    model_bundle_1_v1: Tuple[ModelBundle, Any],
+    model_endpoint_1: Tuple[ModelEndpoint, Any],
+    model_endpoint_2: Tuple[ModelEndpoint, Any],
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    assert model_endpoint_1[0].infra_state is not None
+    assert model_endpoint_2[0].infra_state is not None
+    client = get_test_client_wrapper(
+        fake_docker_repository_image_always_exists=True,
+        fake_model_bundle_repository_contents={
+            model_bundle_1_v1[0].id: model_bundle_1_v1[0],
+        },
+        fake_model_endpoint_record_repository_contents={
+            model_endpoint_1[0].record.id: model_endpoint_1[0].record,
+            model_endpoint_2[0].record.id: model_endpoint_2[0].record,
+        },
+        fake_model_endpoint_infra_gateway_contents={
+            model_endpoint_1[0].infra_state.deployment_name: model_endpoint_1[0].infra_state,
+            model_endpoint_2[0].infra_state.deployment_name: model_endpoint_2[0].infra_state,
+        },
+        fake_batch_job_record_repository_contents={},
+        fake_batch_job_progress_gateway_contents={},
+        fake_docker_image_batch_job_bundle_repository_contents={},
+    )
+    response_1 = client.get("/v1/model-endpoints?order_by=oldest&limit=1", auth=(test_api_key, ""))
+    assert response_1.status_code == 200
+    assert [m["id"] for m in response_1.json()["model_endpoints"]] == [
+        model_endpoint_1[0].record.id
+    ]
+    next_cursor = response_1.json()["next_cursor"]
+    assert next_cursor is not None
+
+    response_2 = client.get(
+        f"/v1/model-endpoints?order_by=oldest&limit=1&cursor={next_cursor}",
+        auth=(test_api_key, ""),
+    )
+    assert response_2.status_code == 200
+    assert [m["id"] for m in response_2.json()["model_endpoints"]] == [
+        model_endpoint_2[0].record.id
+    ]
+    assert response_2.json()["next_cursor"] is None
+
+    response_3 = client.get("/v1/model-endpoints?limit=1&cursor=invalid", auth=(test_api_key, ""))
+    assert response_3.status_code == 400
+
+    response_4 = client.get("/v1/model-endpoints?limit=0", auth=(test_api_key, ""))
+    assert response_4.status_code == 422
 
 
 def test_get_model_endpoint_by_id_success(
@@ -363,6 +438,60 @@ def test_get_model_endpoint_by_id_unauthorized_returns_404(
     assert response.status_code == 404
 
 
+def test_get_model_endpoint_by_id_etag_returns_304_until_updated(
+    model_bundle_1_v1: Tuple[ModelBundle, Any],
+    model_endpoint_1: Tuple[ModelEndpoint, Any],
+    update_model_endpoint_request: Dict[str, Any],
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    assert model_endpoint_1[0].infra_state is not None
+    client = get_test_client_wrapper(
+        fake_docker_repository_image_always_exists=True,
+        fake_model_bundle_repository_contents={
+            model_bundle_1_v1[0].id: model_bundle_1_v1[0],
+        },
+        fake_model_endpoint_record_repository_contents={
+            model_endpoint_1[0].record.id: model_endpoint_1[0].record,
+        },
+        fake_model_endpoint_infra_gateway_contents={
+            model_endpoint_1[0].infra_state.deployment_name: model_endpoint_1[0].infra_state,
+        },
+        fake_batch_job_record_repository_contents={},
+        fake_batch_job_progress_gateway_contents={},
+        fake_docker_image_batch_job_bundle_repository_contents={},
+    )
+    response_1 = client.get(
+        "/v1/model-endpoints/test_model_endpoint_id_1",
+        auth=(test_api_key, ""),
+    )
+    assert response_1.status_code == 200
+    etag = response_1.headers["ETag"]
+
+    response_2 = client.get(
+        "/v1/model-endpoints/test_model_endpoint_id_1",
+        auth=(test_api_key, ""),
+        headers={"If-None-Match": etag},
+    )
+    assert response_2.status_code == 304
+    assert response_2.headers["ETag"] == etag
+
+    response_3 = client.put(
+        "/v1/model-endpoints/test_model_endpoint_id_1",
+        auth=(test_api_key, ""),
+        json=update_model_endpoint_request,
+    )
+    assert response_3.status_code == 200
+
+    response_4 = client.get(
+        "/v1/model-endpoints/test_model_endpoint_id_1",
+        auth=(test_api_key, ""),
+        headers={"If-None-Match": etag},
+    )
+    assert response_4.status_code == 200
+    assert response_4.headers["ETag"] != etag
+
+
 def test_update_model_endpoint_by_id_success(
     model_bundle_1_v1: Tuple[ModelBundle, Any],
     model_endpoint_1: Tuple[ModelEndpoint, Any],
@@ -0,0 +1,44 @@
+import math
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from model_engine_server.api.routing import ORJSONRoute
+
+
+@pytest.fixture
+def client() -> TestClient:
+    router = APIRouter(route_class=ORJSONRoute)
+
+    @router.post("/echo")
+    async def echo(body: dict):
+        return {key: repr(value) for key, value in body.items()}
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_orjson_route_parses_body(client: TestClient):
+    response = client.post("/echo", content=b'{"a": 1, "b": [1.5, "x"]}')
+    assert response.status_code == 200
+    assert response.json() == {"a": "1", "b": "[1.5, 'x']"}
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        (b'{"a": NaN}', repr(math.nan)),
+        (b'{"a": Infinity}', repr(math.inf)),
+        (b'{"a": 123456789012345678901234567890}', "123456789012345678901234567890"),
+    ],
+)
+def test_orjson_route_falls_back_to_stdlib_json(client: TestClient, content: bytes, expected: str):
+    response = client.post("/echo", content=content)
+    assert response.status_code == 200
+    assert response.json() == {"a": expected}
+
+
+def test_orjson_route_malformed_body_returns_422(client: TestClient):
+    response = client.post("/echo", content=b'{"a": ', headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
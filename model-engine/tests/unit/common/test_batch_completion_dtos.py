@@ -0,0 +1,171 @@
+import json
+
+import pytest
+from model_engine_server.common.dtos.llms.batch_completion import (
+    BatchCompletionContentTypeAdapter,
+    CreateBatchCompletionsEngineRequest,
+    CreateBatchCompletionsV1Request,
+    CreateBatchCompletionsV1RequestContent,
+    CreateBatchCompletionsV2Request,
+    FilteredChatCompletionV2Request,
+    FilteredCompletionV2Request,
+)
+from pydantic import ValidationError
+
+
+def test_create_batch_completions_engine_request_from_api_v1_matches_validated():
+    request = CreateBatchCompletionsV1Request(
+        output_data_path="output_data_path",
+        content={"prompts": ["prompt1", "prompt2"], "max_new_tokens": 10, "temperature": 0.5},
+        model_config={"model": "mixtral-8x7b-instruct", "labels": {"team": "infra"}},
+        priority="high",
+    )
+    validated = CreateBatchCompletionsEngineRequest(
+        input_data_path=request.input_data_path,
+        output_data_path=request.output_data_path,
+        content=request.content,
+        model_cfg=request.model_cfg,
+        data_parallelism=request.data_parallelism,
+        max_runtime_sec=request.max_runtime_sec,
+        tool_config=request.tool_config,
+        labels=request.model_cfg.labels,
+        priority=request.priority,
+    )
+
+    constructed = CreateBatchCompletionsEngineRequest.from_api_v1(request)
+
+    assert constructed == validated
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert constructed.model_dump(exclude_unset=True) == validated.model_dump(exclude_unset=True)
+    assert constructed.labels == {"team": "infra"}
+
+
+def test_create_batch_completions_engine_request_from_api_v2_matches_validated():
+    request = CreateBatchCompletionsV2Request(
+        output_data_path="output_data_path",
+        content=[{"prompt": "prompt1", "max_tokens": 10}],
+        model_config={"model": "mixtral-8x7b-instruct"},
+        labels={"team": "infra"},
+    )
+    validated = CreateBatchCompletionsEngineRequest(
+        input_data_path=request.input_data_path,
+        output_data_path=request.output_data_path,
+        content=request.content,
+        model_cfg=request.model_cfg,
+        data_parallelism=request.data_parallelism,
+        max_runtime_sec=request.max_runtime_sec,
+        labels=request.labels,
+        priority=request.priority,
+    )
+
+    constructed = CreateBatchCompletionsEngineRequest.from_api_v2(request)
+
+    assert constructed == validated
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert constructed.model_dump(exclude_unset=True) == validated.model_dump(exclude_unset=True)
+
+
+def test_create_batch_completions_v1_request_content_rejects_empty_prompts():
+    with pytest.raises(ValidationError):
+        CreateBatchCompletionsV1RequestContent(prompts=[], max_new_tokens=10, temperature=0.5)
+
+
+@pytest.mark.parametrize(
+    "content,expected_type",
+    [
+        ([{"prompt": "prompt1", "max_tokens": 10}], FilteredCompletionV2Request),
+        ([{"messages": [{"role": "user", "content": "hi"}]}], FilteredChatCompletionV2Request),
+    ],
+)
+def test_create_batch_completions_v2_request_content_dispatches_on_first_item(
+    content, expected_type
+):
+    request = CreateBatchCompletionsV2Request(
+        output_data_path="output_data_path",
+        content=content,
+        model_config={"model": "mixtral-8x7b-instruct"},
+    )
+
+    assert isinstance(request.content, list)
+    assert isinstance(request.content[0], expected_type)
+
+
+def test_create_batch_completions_engine_request_is_frozen():
+    request = CreateBatchCompletionsEngineRequest.from_api_v2(
+        CreateBatchCompletionsV2Request(
+            output_data_path="output_data_path",
+            content=[{"prompt": "prompt1", "max_tokens": 10}],
+            model_config={"model": "mixtral-8x7b-instruct"},
+        )
+    )
+    with pytest.raises(ValidationError):
+        request.attention_backend = "FLASH_ATTN"
+    with pytest.raises(ValidationError):
+        request.model_cfg.num_shards = 2
+
+    updated = request.model_copy(
+        update={"model_cfg": request.model_cfg.model_copy(update={"num_shards": 2})}
+    )
+    assert updated.model_cfg.num_shards == 2
+    assert request.model_cfg.num_shards == 1
+
+
+@pytest.mark.parametrize(
+    "content,expected_type",
+    [
+        (
+            {"prompts": ["prompt1"], "max_new_tokens": 10, "temperature": 0.5},
+            CreateBatchCompletionsV1RequestContent,
+        ),
+        ([{"prompt": "prompt1", "max_tokens": 10}], FilteredCompletionV2Request),
+        ([{"messages": [{"role": "user", "content": "hi"}]}], FilteredChatCompletionV2Request),
+    ],
+)
+def test_create_batch_completions_engine_request_content_round_trips(content, expected_type):
+    request = CreateBatchCompletionsEngineRequest(
+        output_data_path="output_data_path",
+        content=content,
+        model_config={"model": "mixtral-8x7b-instruct"},
+    )
+
+    parsed = CreateBatchCompletionsEngineRequest.model_validate_json(
+        request.model_dump_json(by_alias=True)
+    )
+
+    assert parsed == request
+    parsed_content = parsed.content[0] if isinstance(parsed.content, list) else parsed.content
+    assert isinstance(parsed_content, expected_type)
+
+
+def test_create_batch_completions_engine_request_serializes_model_config_alias():
+    request = CreateBatchCompletionsEngineRequest.from_api_v2(
+        CreateBatchCompletionsV2Request(
+            output_data_path="output_data_path",
+            content=[{"prompt": "prompt1", "max_tokens": 10}],
+            model_config={"model": "mixtral-8x7b-instruct"},
+        )
+    )
+
+    serialized = json.loads(request.model_dump_json(by_alias=True))
+
+    assert serialized["model_config"]["model"] == "mixtral-8x7b-instruct"
+    assert "model_cfg" not in serialized
+    assert CreateBatchCompletionsEngineRequest.model_validate(serialized) == request
+
+
+@pytest.mark.parametrize(
+    "content,expected_type",
+    [
+        (
+            {"prompts": ["prompt1"], "max_new_tokens": 10, "temperature": 0.5},
+            CreateBatchCompletionsV1RequestContent,
+        ),
+        ([{"prompt": "prompt1", "max_tokens": 10}], FilteredCompletionV2Request),
+        ([{"messages": [{"role": "user", "content": "hi"}]}], FilteredChatCompletionV2Request),
+    ],
+)
+def test_batch_completion_content_type_adapter_validates_json(content, expected_type):
+    parsed = BatchCompletionContentTypeAdapter.validate_json(json.dumps(content))
+
+    parsed_content = parsed[0] if isinstance(parsed, list) else parsed
+    assert isinstance(parsed_content, expected_type)
@@ -0,0 +1,32 @@
+import pytest
+from fastapi import HTTPException
+from model_engine_server.common.concurrency_limiter import MultiprocessingConcurrencyLimiter
+
+
+def test_concurrency_limiter_rejects_requests_over_the_limit():
+    limiter = MultiprocessingConcurrencyLimiter(concurrency=2, fail_on_concurrency_limit=True)
+
+    with limiter:
+        with limiter:
+            with pytest.raises(HTTPException) as exc_info:
+                with limiter:
+                    pass
+            assert exc_info.value.status_code == 429
+
+    # Both slots are released again once the requests finish.
+    with limiter:
+        with limiter:
+            pass
+
+
+def test_concurrency_limiter_without_limit():
+    limiter = MultiprocessingConcurrencyLimiter(concurrency=None, fail_on_concurrency_limit=True)
+
+    with limiter:
+        with limiter:
+            pass
+
+
+def test_concurrency_limiter_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        MultiprocessingConcurrencyLimiter(concurrency=0, fail_on_concurrency_limit=True)
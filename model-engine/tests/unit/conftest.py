@@ -146,6 +146,7 @@ from model_engine_server.infra.repositories import (
     LLMFineTuneRepository,
     ModelEndpointCacheRepository,
     ModelEndpointRecordRepository,
+    ModelEndpointResponseCacheRepository,
 )
 from model_engine_server.infra.repositories.db_model_bundle_repository import (
     translate_kwargs_to_model_bundle_orm,
@@ -159,6 +160,9 @@ from model_engine_server.infra.services.live_llm_batch_completions_service impor
 from model_engine_server.infra.services.live_llm_model_endpoint_service import (
     LiveLLMModelEndpointService,
 )
+from model_engine_server.infra.services.live_model_endpoint_service import (
+    paginate_model_endpoint_records,
+)
 from transformers import AutoTokenizer
 
 
@@ -700,6 +704,13 @@ class FakeModelEndpointCacheRepository(ModelEndpointCacheRepository):
     ) -> Optional[ModelEndpointInfraState]:
         return self.db.get(endpoint_id, None)
 
+    async def read_endpoint_infos(
+        self, endpoint_ids_and_deployment_names: Sequence[Tuple[str, str]]
+    ) -> List[Optional[ModelEndpointInfraState]]:
+        return [
+            self.db.get(endpoint_id, None) for endpoint_id, _ in endpoint_ids_and_deployment_names
+        ]
+
     def force_expire_key(self, endpoint_id: str):
         """
         Use to simulate key expiring
@@ -708,6 +719,35 @@ class FakeModelEndpointCacheRepository(ModelEndpointCacheRepository):
             del self.db[endpoint_id]
 
 
+class FakeModelEndpointResponseCacheRepository(ModelEndpointResponseCacheRepository):
+    def __init__(self):
+        self.db: Dict[str, Dict[str, bytes]] = {}
+        self.generations: Dict[str, int] = {}
+
+    async def write_model_endpoint_response(
+        self,
+        model_endpoint_id: str,
+        owner: str,
+        response: bytes,
+        ttl_seconds: float,
+        generation: int,
+    ):
+        if self.generations.get(model_endpoint_id, 0) == generation:
+            self.db.setdefault(model_endpoint_id, {})[owner] = response
+
+    async def read_model_endpoint_response(
+        self, model_endpoint_id: str, owner: str
+    ) -> Tuple[Optional[bytes], int]:
+        return (
+            self.db.get(model_endpoint_id, {}).get(owner),
+            self.generations.get(model_endpoint_id, 0),
+        )
+
+    async def invalidate_model_endpoint(self, model_endpoint_id: str):
+        self.db.pop(model_endpoint_id, None)
+        self.generations[model_endpoint_id] = self.generations.get(model_endpoint_id, 0) + 1
+
+
 class FakeFeatureFlagRepository(FeatureFlagRepository):
     def __init__(self):
         self.db = {}
@@ -1903,11 +1943,18 @@ class FakeModelEndpointService(ModelEndpointService):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> List[ModelEndpoint]:
         def filter_fn(m: ModelEndpoint) -> bool:
             return self._filter_by_name_owner(m.record, owner, name)
 
         model_endpoints = list(filter(filter_fn, self.db.values()))
+        if limit is not None or after is not None:
+            records = paginate_model_endpoint_records(
+                [m.record for m in model_endpoints], order_by, limit, after
+            )
+            return [self.db[r.id] for r in records]
         if order_by == ModelEndpointOrderBy.NEWEST:
             model_endpoints.sort(key=lambda x: x.record.created_at, reverse=True)
         elif order_by == ModelEndpointOrderBy.OLDEST:
@@ -1962,11 +2009,18 @@ class FakeLLMModelEndpointService(LLMModelEndpointService):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> List[ModelEndpoint]:
         def filter_fn(m: ModelEndpoint) -> bool:
             return self._filter_by_name_owner(m.record, owner, name)
 
         model_endpoints = list(filter(filter_fn, self.db.values()))
+        if limit is not None or after is not None:
+            records = paginate_model_endpoint_records(
+                [m.record for m in model_endpoints], order_by, limit, after
+            )
+            return [self.db[r.id] for r in records]
         if order_by == ModelEndpointOrderBy.NEWEST:
             model_endpoints.sort(key=lambda x: x.record.created_at, reverse=True)
         elif order_by == ModelEndpointOrderBy.OLDEST:
@@ -2021,6 +2075,12 @@ def fake_model_endpoint_cache_repository() -> FakeModelEndpointCacheRepository:
     return repo
 
 
+@pytest.fixture
+def fake_model_endpoint_response_cache_repository() -> FakeModelEndpointResponseCacheRepository:
+    repo = FakeModelEndpointResponseCacheRepository()
+    return repo
+
+
 @pytest.fixture
 def fake_feature_flag_repository() -> FakeFeatureFlagRepository:
     repo = FakeFeatureFlagRepository()
@@ -2223,6 +2283,9 @@ def get_repositories_generator_wrapper():
         fake_file_system_gateway_contents,
         fake_sync_inference_content,
     ):
+        # Shared across requests so that cached responses outlive a single request, as in Redis.
+        fake_model_endpoint_response_cache_repository = FakeModelEndpointResponseCacheRepository()
+
         def get_test_repositories() -> Iterator[ExternalInterfaces]:
             fake_file_system_gateway = FakeFilesystemGateway()
             fake_model_bundle_repository = FakeModelBundleRepository(
@@ -2258,6 +2321,7 @@ def get_repositories_generator_wrapper():
                 sync_model_endpoint_inference_gateway=sync_model_endpoint_inference_gateway,
                 inference_autoscaling_metrics_gateway=inference_autoscaling_metrics_gateway,
                 model_endpoints_schema_gateway=model_endpoints_schema_gateway,
+                model_endpoint_response_cache_repository=fake_model_endpoint_response_cache_repository,
             )
             fake_batch_job_service = LiveBatchJobService(
                 batch_job_record_repository=FakeBatchJobRecordRepository(
@@ -2324,6 +2388,7 @@ def get_repositories_generator_wrapper():
                 monitoring_metrics_gateway=fake_monitoring_metrics_gateway,
                 tokenizer_repository=fake_tokenizer_repository,
                 streaming_storage_gateway=fake_streaming_storage_gateway,
+                model_endpoint_response_cache_repository=fake_model_endpoint_response_cache_repository,
             )
             try:
                 yield repositories
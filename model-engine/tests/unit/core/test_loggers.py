@@ -0,0 +1,22 @@
+import pytest
+from model_engine_server.core.loggers import logger_name
+
+
+def test_logger_name_returns_calling_module_name():
+    assert logger_name() == __name__
+
+
+def test_logger_name_uses_file_name_for_main_module():
+    calling_globals = {
+        "__name__": "__main__",
+        "__file__": "/path/to/script.py",
+        "logger_name": logger_name,
+    }
+    assert eval("logger_name()", calling_globals) == "script"
+
+
+def test_logger_name_uses_fallback_name_without_file():
+    calling_globals = {"__name__": "__main__", "logger_name": logger_name}
+    assert eval("logger_name(fallback_name='fallback')", calling_globals) == "fallback"
+    with pytest.raises(ValueError):
+        eval("logger_name()", calling_globals)
@@ -1,4 +1,5 @@
 import pytest
+from model_engine_server.common.serialization_utils import python_json_to_b64
 from model_engine_server.domain.entities import (
     CallbackAuth,
     CallbackBasicAuth,
@@ -36,6 +37,27 @@ def test_model_endpoint_config_serialization(model_endpoint_config: ModelEndpoin
     assert model_endpoint_config == deserialized_config
 
 
+def test_model_endpoint_config_deserializes_json_dumps_format():
+    model_endpoint_config = ModelEndpointConfig(
+        endpoint_name="test_endpoint",
+        bundle_name="test_bundle",
+        billing_tags={"team": "infra", "project": None},
+        default_callback_auth=CallbackAuth(
+            root=CallbackBasicAuth(kind="basic", username="test_user", password="test_password")
+        ),
+        endpoint_type="sync",
+    )
+    # Pods created before serialize() moved to model_dump_json carry configs in this format.
+    serialized_config = python_json_to_b64(
+        {k: v for k, v in model_endpoint_config.dict().items() if v is not None}
+    )
+
+    assert ModelEndpointConfig.deserialize(serialized_config) == model_endpoint_config
+    assert (
+        ModelEndpointConfig.deserialize(model_endpoint_config.serialize()) == model_endpoint_config
+    )
+
+
 def test_model_bundle_is_runnable(
     model_bundle_1: ModelBundle,
     model_bundle_2: ModelBundle,
@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 from model_engine_server.common.dtos.model_endpoints import (
     CreateModelEndpointV1Request,
@@ -721,6 +723,89 @@ async def test_list_model_endpoints(
     assert len(response_4.model_endpoints) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_model_endpoints_paginated(
+    test_api_key: str,
+    fake_model_endpoint_service,
+    model_endpoint_1: ModelEndpoint,
+    model_endpoint_2: ModelEndpoint,
+):
+    fake_model_endpoint_service.add_model_endpoint(model_endpoint_1)
+    fake_model_endpoint_service.add_model_endpoint(model_endpoint_2)
+    use_case = ListModelEndpointsV1UseCase(model_endpoint_service=fake_model_endpoint_service)
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+
+    response_1 = await use_case.execute(user=user, name=None, order_by=None, limit=1)
+    assert [m.name for m in response_1.model_endpoints] == ["test_model_endpoint_name_2"]
+    assert response_1.next_cursor is not None
+
+    # Deleting the last endpoint of a page doesn't affect the next one.
+    await fake_model_endpoint_service.delete_model_endpoint(model_endpoint_2.record.id)
+    response_2 = await use_case.execute(
+        user=user, name=None, order_by=None, limit=1, cursor=response_1.next_cursor
+    )
+    assert [m.name for m in response_2.model_endpoints] == ["test_model_endpoint_name_1"]
+    assert response_2.next_cursor is None
+
+    response_3 = await use_case.execute(
+        user=user, name=None, order_by=ModelEndpointOrderBy.OLDEST, limit=2
+    )
+    assert [m.name for m in response_3.model_endpoints] == ["test_model_endpoint_name_1"]
+    assert response_3.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_model_endpoints_paginated_mixed_timezones(
+    test_api_key: str,
+    fake_model_endpoint_service,
+    model_endpoint_1: ModelEndpoint,
+    model_endpoint_2: ModelEndpoint,
+):
+    # One record with a naive timestamp and one with an aware one, as can come from the DB.
+    created_at = model_endpoint_2.record.created_at
+    model_endpoint_1.record.created_at = model_endpoint_1.record.created_at.replace(tzinfo=None)
+    model_endpoint_2.record.created_at = created_at.replace(
+        tzinfo=created_at.tzinfo or datetime.timezone.utc
+    )
+    fake_model_endpoint_service.add_model_endpoint(model_endpoint_1)
+    fake_model_endpoint_service.add_model_endpoint(model_endpoint_2)
+    use_case = ListModelEndpointsV1UseCase(model_endpoint_service=fake_model_endpoint_service)
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+
+    response_1 = await use_case.execute(user=user, name=None, order_by=None, limit=1)
+    assert [m.name for m in response_1.model_endpoints] == ["test_model_endpoint_name_2"]
+    response_2 = await use_case.execute(
+        user=user, name=None, order_by=None, limit=1, cursor=response_1.next_cursor
+    )
+    assert [m.name for m in response_2.model_endpoints] == ["test_model_endpoint_name_1"]
+
+
+@pytest.mark.asyncio
+async def test_list_model_endpoints_paginated_alphabetical_raises(
+    test_api_key: str,
+    fake_model_endpoint_service,
+    model_endpoint_1: ModelEndpoint,
+):
+    fake_model_endpoint_service.add_model_endpoint(model_endpoint_1)
+    use_case = ListModelEndpointsV1UseCase(model_endpoint_service=fake_model_endpoint_service)
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+    with pytest.raises(ObjectHasInvalidValueException):
+        await use_case.execute(
+            user=user, name=None, order_by=ModelEndpointOrderBy.ALPHABETICAL, limit=1
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_model_endpoints_invalid_cursor_raises(
+    test_api_key: str,
+    fake_model_endpoint_service,
+):
+    use_case = ListModelEndpointsV1UseCase(model_endpoint_service=fake_model_endpoint_service)
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+    with pytest.raises(ObjectHasInvalidValueException):
+        await use_case.execute(user=user, name=None, order_by=None, limit=1, cursor="invalid")
+
+
 @pytest.mark.asyncio
 async def test_list_model_endpoints_team(
     test_api_key_user_on_other_team: str,
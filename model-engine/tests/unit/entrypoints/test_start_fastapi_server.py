@@ -0,0 +1,37 @@
+from unittest import mock
+
+import pytest
+from model_engine_server.entrypoints.start_fastapi_server import (
+    DEFAULT_NUM_WORKERS,
+    MAX_NUM_WORKERS,
+    get_default_num_workers,
+)
+
+
+@pytest.fixture
+def cpu_quota(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    with mock.patch(
+        "model_engine_server.entrypoints.start_fastapi_server.get_container_cpu_quota"
+    ) as get_container_cpu_quota:
+        yield get_container_cpu_quota
+
+
+def test_get_default_num_workers_without_quota(cpu_quota):
+    cpu_quota.return_value = None
+    assert get_default_num_workers() == DEFAULT_NUM_WORKERS
+
+
+def test_get_default_num_workers_with_quota(cpu_quota):
+    cpu_quota.return_value = 1.5
+    assert get_default_num_workers() == 5
+
+
+def test_get_default_num_workers_is_capped(cpu_quota):
+    cpu_quota.return_value = 64
+    assert get_default_num_workers() == MAX_NUM_WORKERS
+
+
+def test_get_default_num_workers_web_concurrency(cpu_quota):
+    with mock.patch.dict("os.environ", {"WEB_CONCURRENCY": "32"}):
+        assert get_default_num_workers() == 32
@@ -1,5 +1,10 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+from unittest import mock
 from unittest.mock import MagicMock
 
+import orjson
 import pytest
 from model_engine_server.inference.batch_inference.dto import (
     CompletionOutput,
@@ -16,6 +21,55 @@ def anyio_backend():
     return "asyncio"
 
 
+@dataclass
+class FakeAiohttpResponse:
+    status: int
+    content: bytes
+
+    released: bool = False
+
+    async def __aenter__(self) -> "FakeAiohttpResponse":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.released = True
+
+    async def read(self) -> bytes:
+        return self.content
+
+
+class FakeAiohttpClientSession:
+    """
+    Stands in for the forwarder's pooled aiohttp session. Maps URLs to (status, JSON body), where a
+    bytes body is returned as is.
+    """
+
+    def __init__(self):
+        self.responses: Dict[str, Tuple[int, Any]] = {}
+        self.requests: List[Tuple[str, Any]] = []
+        self.sent_responses: List[FakeAiohttpResponse] = []
+        self.closed = False
+
+    def post(self, url: str, data: Any = None, **kwargs) -> FakeAiohttpResponse:
+        self.requests.append((url, json.loads(data)))
+        status, body = self.responses[url]
+        content = body if isinstance(body, bytes) else orjson.dumps(body)
+        response = FakeAiohttpResponse(status=status, content=content)
+        self.sent_responses.append(response)
+        return response
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_aiohttp_client_session():
+    session = FakeAiohttpClientSession()
+    with mock.patch("model_engine_server.inference.forwarding.forwarding.aiohttp") as mock_aiohttp:
+        mock_aiohttp.ClientSession.return_value = session
+        yield session
+
+
 @pytest.fixture
 def create_batch_completions_engine_request() -> CreateBatchCompletionsEngineRequest:
     model_config = CreateBatchCompletionsModelConfig(
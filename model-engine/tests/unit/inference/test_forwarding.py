@@ -1,4 +1,5 @@
 import json
+import math
 from dataclasses import dataclass
 from typing import Mapping
 from unittest import mock
@@ -449,3 +450,75 @@ def test_streaming_forwarder_loader():
     fwd = LoadStreamingForwarder(serialize_results_as_string=False).load(None, None)  # type: ignore
     response = fwd({"ignore": "me"})
     _check_streaming(response)
+
+
+@pytest.mark.anyio
+async def test_forwarder_acall(post_inference_hooks_handler, fake_aiohttp_client_session):
+    fwd = Forwarder(
+        "http://localhost:5005/predict",
+        model_engine_unwrap=True,
+        serialize_results_as_string=False,
+        post_inference_hooks_handler=post_inference_hooks_handler,
+        wrap_response=True,
+        forward_http_status=True,
+    )
+    fake_aiohttp_client_session.responses[fwd.predict_endpoint] = (500, PAYLOAD)
+
+    json_response = await fwd.acall({"args": {"ignore": "me"}})
+
+    _check(json_response)
+    assert json_response.status_code == 500
+    assert fake_aiohttp_client_session.requests == [(fwd.predict_endpoint, {"ignore": "me"})]
+
+    assert all(response.released for response in fake_aiohttp_client_session.sent_responses)
+
+    await fwd.aclose()
+    assert fake_aiohttp_client_session.closed
+
+
+@pytest.mark.anyio
+async def test_forwarder_acall_accepts_non_finite_floats(
+    post_inference_hooks_handler, fake_aiohttp_client_session
+):
+    fwd = Forwarder(
+        "http://localhost:5005/predict",
+        model_engine_unwrap=True,
+        serialize_results_as_string=False,
+        post_inference_hooks_handler=post_inference_hooks_handler,
+        wrap_response=True,
+        forward_http_status=False,
+    )
+    fake_aiohttp_client_session.responses[fwd.predict_endpoint] = (
+        200,
+        b'{"logprobs": [NaN, -Infinity]}',
+    )
+
+    response = await fwd.acall({"args": {"ignore": "me"}})
+
+    logprobs = response["result"]["logprobs"]
+    assert math.isnan(logprobs[0])
+    assert logprobs[1] == -math.inf
+
+
+@pytest.mark.asyncio
+async def test_forwarder_acall_keeps_wide_integers_exact(
+    post_inference_hooks_handler, fake_aiohttp_client_session
+):
+    fwd = Forwarder(
+        "http://localhost:5005/predict",
+        model_engine_unwrap=True,
+        serialize_results_as_string=False,
+        post_inference_hooks_handler=post_inference_hooks_handler,
+        wrap_response=True,
+        forward_http_status=False,
+    )
+    wide_integer = 2**64 + 1
+    fake_aiohttp_client_session.responses[fwd.predict_endpoint] = (
+        200,
+        b'{"token_id": %d}' % wide_integer,
+    )
+
+    response = await fwd.acall({"args": {"seed": wide_integer}})
+
+    assert fake_aiohttp_client_session.requests[0][1] == {"seed": wide_integer}
+    assert response["result"]["token_id"] == wide_integer
@@ -1,19 +1,22 @@
+import asyncio
 import json
 import threading
 from dataclasses import dataclass
 from typing import Mapping
 from unittest import mock
 
+import orjson
 import pytest
 import requests_mock
 from fastapi import BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.testclient import TestClient
 from model_engine_server.common.dtos.tasks import EndpointPredictV1Request
 from model_engine_server.domain.entities.model_endpoint_entity import ModelEndpointConfig
 from model_engine_server.inference.forwarding.forwarding import Forwarder
 from model_engine_server.inference.forwarding.http_forwarder import (
     MultiprocessingConcurrencyLimiter,
+    encode_sse_data,
     get_concurrency_limiter,
     get_forwarder_loader,
     get_streaming_forwarder_loader,
@@ -24,6 +27,7 @@ from model_engine_server.inference.infra.gateways.datadog_inference_monitoring_m
     DatadogInferenceMonitoringMetricsGateway,
 )
 from model_engine_server.inference.post_inference_hooks import PostInferenceHooksHandler
+from sse_starlette.sse import ServerSentEvent
 from tests.unit.conftest import FakeStreamingStorageGateway
 
 PAYLOAD: Mapping[str, str] = {"hello": "world"}
@@ -190,10 +194,12 @@ def test_http_service_429(mock_request, post_inference_hooks_handler):
     )
     limiter = MultiprocessingConcurrencyLimiter(1, True)
     t1 = ExceptionCapturedThread(
-        target=predict, args=(mock_request, BackgroundTasks(), mock_forwarder, limiter)
+        target=lambda *args: asyncio.run(predict(*args)),
+        args=(mock_request, BackgroundTasks(), mock_forwarder, limiter),
     )
     t2 = ExceptionCapturedThread(
-        target=predict, args=(mock_request, BackgroundTasks(), mock_forwarder, limiter)
+        target=lambda *args: asyncio.run(predict(*args)),
+        args=(mock_request, BackgroundTasks(), mock_forwarder, limiter),
     )
     t1.start()
     t2.start()
@@ -202,6 +208,39 @@ def test_http_service_429(mock_request, post_inference_hooks_handler):
         t2.join()
 
 
+@pytest.mark.anyio
+async def test_predict_awaits_async_forwarder(mock_request):
+    forwarder = mock.Mock()
+    forwarder.acall = mock.AsyncMock(return_value=PAYLOAD)
+    limiter = MultiprocessingConcurrencyLimiter(1, True)
+    background_tasks = BackgroundTasks()
+
+    response = await predict(mock_request, background_tasks, forwarder, limiter)
+
+    assert isinstance(response, ORJSONResponse)
+    assert orjson.loads(response.body) == PAYLOAD
+    forwarder.acall.assert_awaited_once_with(mock_request.model_dump())
+    forwarder.assert_not_called()
+    assert len(background_tasks.tasks) == 1
+
+
+@pytest.mark.anyio
+async def test_predict_skips_background_task_without_hooks(
+    mock_request, post_inference_hooks_handler
+):
+    forwarder = mock.Mock()
+    forwarder.acall = mock.AsyncMock(return_value=PAYLOAD)
+    forwarder.post_inference_hooks_handler = post_inference_hooks_handler
+    background_tasks = BackgroundTasks()
+
+    await predict(
+        mock_request, background_tasks, forwarder, MultiprocessingConcurrencyLimiter(1, True)
+    )
+
+    assert not post_inference_hooks_handler.has_hooks()
+    assert background_tasks.tasks == []
+
+
 def test_handler_response(post_inference_hooks_handler):
     try:
         post_inference_hooks_handler.handle(
@@ -338,7 +377,7 @@ def wrap_result(result):
     "model_engine_server.inference.forwarding.forwarding.get_endpoint_config",
     mocked_get_endpoint_config,
 )
-async def test_mocked_app_success(mocked_app):
+async def test_mocked_app_success(mocked_app, fake_aiohttp_client_session):
     config = mocked_get_config_with_extra_paths()
     config_sync = config["sync"]
     # config_stream = config["stream"]
@@ -358,14 +397,119 @@ async def test_mocked_app_success(mocked_app):
     )
     with TestClient(mocked_app) as client, requests_mock.Mocker() as req_mock:
         req_mock.get(healthcheck_endpoint, json={"status": "ok"})
-        req_mock.post(predict_endpoint, json=raw_result)
+        fake_aiohttp_client_session.responses[predict_endpoint] = (200, raw_result)
         response = client.post("/predict", json=payload)
         assert response.status_code == 200
         assert response.json() == expected_result
 
-        req_mock.post(chat_endpoint, json=raw_result)
+        fake_aiohttp_client_session.responses[chat_endpoint] = (200, raw_result)
         response = client.post("/v1/chat/completions", json=payload)
         assert response.status_code == 200
         assert response.json() == expected_result
 
         # TODO: add tests for streaming; it's not as trivial as I'd hoped
+
+
+@pytest.mark.anyio
+@mock.patch(
+    "model_engine_server.inference.forwarding.http_forwarder.get_config",
+    mocked_get_config_with_extra_paths,
+)
+@mock.patch(
+    "model_engine_server.inference.forwarding.forwarding.get_endpoint_config",
+    mocked_get_endpoint_config,
+)
+async def test_mocked_app_invalid_body_returns_422(mocked_app):
+    config = mocked_get_config_with_extra_paths()
+    healthcheck_endpoint = get_healthcheck_endpoint(config)
+
+    with TestClient(mocked_app) as client, requests_mock.Mocker() as req_mock:
+        req_mock.get(healthcheck_endpoint, json={"status": "ok"})
+        response = client.post(
+            "/predict", content=b"{not json", headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 422
+
+        response = client.post("/predict", json={"return_pickled": "not a bool"})
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "return_pickled"]
+
+
+def mocked_get_config_with_two_extra_paths():
+    config = mocked_get_config_with_extra_paths()
+    config["sync"]["extra_routes"] = ["/v1/chat/completions", "/v1/completions"]
+    config["stream"]["extra_routes"] = []
+    return config
+
+
+@pytest.mark.anyio
+@mock.patch(
+    "model_engine_server.inference.forwarding.http_forwarder.get_config",
+    mocked_get_config_with_two_extra_paths,
+)
+@mock.patch(
+    "model_engine_server.inference.forwarding.forwarding.get_endpoint_config",
+    mocked_get_endpoint_config,
+)
+async def test_mocked_app_extra_routes_use_their_own_forwarder(fake_aiohttp_client_session):
+    config = mocked_get_config_with_two_extra_paths()
+    healthcheck_endpoint = get_healthcheck_endpoint(config)
+    base_endpoint = f"http://{config['sync']['user_hostname']}:{config['sync']['user_port']}"
+
+    with requests_mock.Mocker() as req_mock:
+        req_mock.get(healthcheck_endpoint, json={"status": "ok"})
+        app = await init_app()
+
+    with TestClient(app) as client:
+        fake_aiohttp_client_session.responses.update(
+            {
+                f"{base_endpoint}/v1/chat/completions": (200, {"route": "chat"}),
+                f"{base_endpoint}/v1/completions": (200, {"route": "completions"}),
+            }
+        )
+        payload = wrap_request({"prompt": "Hello", "stream": False})
+
+        response = client.post("/v1/chat/completions", json=payload)
+        assert response.json() == wrap_result(json.dumps({"route": "chat"}))
+
+        response = client.post("/v1/completions", json=payload)
+        assert response.json() == wrap_result(json.dumps({"route": "completions"}))
+
+
+@pytest.mark.parametrize(
+    "response",
+    [{"result": {"token": "hello\nworld"}}, {"result": "a string"}, {"error": None}],
+)
+def test_encode_sse_data_matches_server_sent_event(response):
+    assert (
+        encode_sse_data(response)
+        == ServerSentEvent(data=orjson.dumps(response).decode("utf-8")).encode()
+    )
+
+
+@pytest.mark.anyio
+async def test_mocked_app_healthcheck(mocked_app):
+    with TestClient(mocked_app) as client:
+        for path in ["/healthz", "/readyz"]:
+            response = client.get(path)
+            assert response.status_code == 200
+            assert response.json() == "OK"
+
+
+@pytest.mark.anyio
+@mock.patch(
+    "model_engine_server.inference.forwarding.http_forwarder.get_config",
+    mocked_get_config_with_extra_paths,
+)
+async def test_mocked_app_lifespan_closes_forwarder_sessions(
+    mocked_app, fake_aiohttp_client_session
+):
+    predict_endpoint = get_predict_endpoint(mocked_get_config_with_extra_paths())
+    fake_aiohttp_client_session.responses[predict_endpoint] = (200, {"message": "Hello World"})
+
+    with TestClient(mocked_app) as client:
+        response = client.post("/predict", json=wrap_request({"prompt": "Hello"}))
+        assert response.status_code == 200
+        assert not fake_aiohttp_client_session.closed
+
+    assert fake_aiohttp_client_session.closed
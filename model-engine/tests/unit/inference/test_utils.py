@@ -0,0 +1,44 @@
+import pytest
+from model_engine_server.inference import utils
+from model_engine_server.inference.utils import get_container_cpu_quota, get_cpu_cores_in_container
+
+
+@pytest.fixture
+def cgroup_files(tmp_path, monkeypatch):
+    paths = {
+        "CGROUP_V2_CPU_MAX_PATH": tmp_path / "cpu.max",
+        "CGROUP_V1_CPU_QUOTA_PATH": tmp_path / "cpu.cfs_quota_us",
+        "CGROUP_V1_CPU_PERIOD_PATH": tmp_path / "cpu.cfs_period_us",
+    }
+    for name, path in paths.items():
+        monkeypatch.setattr(utils, name, str(path))
+    return paths
+
+
+def test_get_container_cpu_quota_cgroup_v2(cgroup_files):
+    cgroup_files["CGROUP_V2_CPU_MAX_PATH"].write_text("250000 100000\n")
+    assert get_container_cpu_quota() == 2.5
+    assert get_cpu_cores_in_container() == 2
+
+
+def test_get_container_cpu_quota_cgroup_v2_unlimited(cgroup_files):
+    cgroup_files["CGROUP_V2_CPU_MAX_PATH"].write_text("max 100000\n")
+    assert get_container_cpu_quota() is None
+
+
+def test_get_container_cpu_quota_cgroup_v1(cgroup_files):
+    cgroup_files["CGROUP_V1_CPU_QUOTA_PATH"].write_text("200000\n")
+    cgroup_files["CGROUP_V1_CPU_PERIOD_PATH"].write_text("100000\n")
+    assert get_container_cpu_quota() == 2
+    assert get_cpu_cores_in_container() == 2
+
+
+def test_get_container_cpu_quota_cgroup_v1_unlimited(cgroup_files):
+    cgroup_files["CGROUP_V1_CPU_QUOTA_PATH"].write_text("-1\n")
+    cgroup_files["CGROUP_V1_CPU_PERIOD_PATH"].write_text("100000\n")
+    assert get_container_cpu_quota() is None
+
+
+def test_get_cpu_cores_in_container_without_quota(cgroup_files, monkeypatch):
+    monkeypatch.setattr("multiprocessing.cpu_count", lambda: 64)
+    assert get_cpu_cores_in_container() == 64
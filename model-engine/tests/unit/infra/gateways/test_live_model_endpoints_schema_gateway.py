@@ -180,3 +180,20 @@ def test_get_model_endpoints_schema_success(
         model_endpoint_records=[model_endpoint_1.record, model_endpoint_2.record],
     )
     assert schema is not None
+
+
+def test_update_model_definitions_with_prefix_prefixes_predict_models(
+    live_model_endpoints_schema_gateway: LiveModelEndpointsSchemaGateway,
+):
+    definitions_1 = live_model_endpoints_schema_gateway.update_model_definitions_with_prefix(
+        prefix="endpoint_1", model_definitions={}
+    )
+    definitions_2 = live_model_endpoints_schema_gateway.update_model_definitions_with_prefix(
+        prefix="endpoint_2", model_definitions={}
+    )
+
+    for suffix in ["EndpointPredictRequest", "GetAsyncTaskResponse", "SyncEndpointPredictResponse"]:
+        assert f"endpoint_1-{suffix}" in definitions_1
+        assert f"endpoint_1-{suffix}" not in definitions_2
+        assert definitions_1[f"endpoint_1-{suffix}"] == definitions_2[f"endpoint_2-{suffix}"]
+    assert "EndpointPredictV1Request" not in definitions_1
@@ -1,5 +1,5 @@
 import datetime
-from typing import Callable, Optional, Union
+from typing import Any, Callable, List, Optional, Union
 
 import pytest
 from model_engine_server.db.models import BatchJob, Bundle
@@ -39,6 +39,30 @@ class FakeRedis:
     async def get(self, key: str) -> Optional[bytes]:
         return self.db.get(key, None)
 
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.db.get(key, None) for key in keys]
+
+    async def hset(self, name: str, key: str, value: bytes):
+        self.db.setdefault(name, {})[key] = value
+
+    async def hget(self, name: str, key: str) -> Optional[bytes]:
+        return self.db.get(name, {}).get(key, None)
+
+    async def incr(self, name: str) -> int:
+        value = int(self.db.get(name, 0)) + 1
+        self.db[name] = str(value).encode()
+        return value
+
+    async def expire(self, name: str, time: int):
+        pass
+
+    async def delete(self, *names: str):
+        for name in names:
+            self.db.pop(name, None)
+
+    def pipeline(self, transaction: bool = True) -> "FakeRedisPipeline":
+        return FakeRedisPipeline(self)
+
     def force_expire_all(self):
         self.db = {}
 
@@ -46,6 +70,60 @@ class FakeRedis:
         pass
 
 
+class FakeRedisPipeline:
+    """
+    Buffers commands and runs them against the FakeRedis on execute(). Like redis-py, commands run
+    immediately after watch() until multi() is called.
+    """
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands: List[Callable] = []
+        self.watching = False
+
+    async def __aenter__(self) -> "FakeRedisPipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.commands = []
+        self.watching = False
+
+    async def watch(self, *names: str) -> None:
+        self.watching = True
+
+    def multi(self) -> None:
+        self.watching = False
+
+    def _command(self, command: Callable) -> Any:
+        if self.watching:
+            return command()
+        self.commands.append(command)
+        return self
+
+    def get(self, key: str) -> Any:
+        return self._command(lambda: self.redis.get(key))
+
+    def hget(self, name: str, key: str) -> Any:
+        return self._command(lambda: self.redis.hget(name, key))
+
+    def hset(self, name: str, key: str, value: bytes) -> Any:
+        return self._command(lambda: self.redis.hset(name, key, value))
+
+    def incr(self, name: str) -> Any:
+        return self._command(lambda: self.redis.incr(name))
+
+    def expire(self, name: str, time: int) -> Any:
+        return self._command(lambda: self.redis.expire(name, time))
+
+    def delete(self, *names: str) -> Any:
+        return self._command(lambda: self.redis.delete(*names))
+
+    async def execute(self) -> list:
+        results = [await command() for command in self.commands]
+        self.commands = []
+        return results
+
+
 @pytest.fixture
 def fake_redis():
     return FakeRedis()
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import Mock
 
 import aioredis
@@ -32,3 +33,53 @@ async def test_read_write_cache(entity_model_endpoint_infra_state, fake_redis):
         endpoint_id=endpoint_id,
         deployment_name=entity_model_endpoint_infra_state.deployment_name,
     )
+
+
+@pytest.mark.asyncio
+async def test_read_endpoint_infos(entity_model_endpoint_infra_state, fake_redis):
+    aioredis.client.Redis.from_url = Mock(return_value=fake_redis)
+    repo = RedisModelEndpointCacheRepository(redis_info="redis://test")
+    deployment_name = entity_model_endpoint_infra_state.deployment_name
+    await repo.write_endpoint_info(
+        endpoint_id="my_endpoint_id",
+        endpoint_info=entity_model_endpoint_infra_state,
+        ttl_seconds=60,
+    )
+    # Entries written under the deprecated deployment name key are still found.
+    await repo.write_endpoint_info(
+        endpoint_id="", endpoint_info=entity_model_endpoint_infra_state, ttl_seconds=60
+    )
+
+    infra_states = await repo.read_endpoint_infos(
+        [
+            ("my_endpoint_id", "other_deployment_name"),
+            ("legacy_endpoint_id", deployment_name),
+            ("missing_endpoint_id", "missing_deployment_name"),
+        ]
+    )
+    assert infra_states == [
+        entity_model_endpoint_infra_state,
+        entity_model_endpoint_infra_state,
+        None,
+    ]
+    assert await repo.read_endpoint_infos([]) == []
+
+
+@pytest.mark.asyncio
+async def test_read_endpoint_info_written_with_json_dumps(
+    entity_model_endpoint_infra_state, fake_redis
+):
+    aioredis.client.Redis.from_url = Mock(return_value=fake_redis)
+    repo = RedisModelEndpointCacheRepository(redis_info="redis://test")
+    # Entries written before the cache switched to model_dump_json are still readable.
+    await fake_redis.set(
+        repo._find_redis_key("my_endpoint_id"),
+        json.dumps(entity_model_endpoint_infra_state.dict()),
+        ex=60,
+    )
+
+    infra_state = await repo.read_endpoint_info(
+        endpoint_id="my_endpoint_id",
+        deployment_name=entity_model_endpoint_infra_state.deployment_name,
+    )
+    assert infra_state == entity_model_endpoint_infra_state
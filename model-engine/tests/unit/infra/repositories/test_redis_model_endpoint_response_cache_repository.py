@@ -0,0 +1,63 @@
+from unittest.mock import Mock
+
+import aioredis
+import pytest
+from model_engine_server.infra.repositories.redis_model_endpoint_response_cache_repository import (
+    RedisModelEndpointResponseCacheRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_read_write_invalidate_cache(fake_redis):
+    aioredis.client.Redis.from_url = Mock(return_value=fake_redis)
+    repo = RedisModelEndpointResponseCacheRepository(redis_info="redis://test")
+    endpoint_id = "my_endpoint_id"
+    response, generation = await repo.read_model_endpoint_response(
+        model_endpoint_id=endpoint_id, owner="team"
+    )
+    assert response is None
+    await repo.write_model_endpoint_response(
+        model_endpoint_id=endpoint_id,
+        owner="team",
+        response=b'{"id": 1}',
+        ttl_seconds=30,
+        generation=generation,
+    )
+    assert await repo.read_model_endpoint_response(model_endpoint_id=endpoint_id, owner="team") == (
+        b'{"id": 1}',
+        generation,
+    )
+    response, _ = await repo.read_model_endpoint_response(
+        model_endpoint_id=endpoint_id, owner="other_team"
+    )
+    assert response is None
+    await repo.invalidate_model_endpoint(model_endpoint_id=endpoint_id)
+    assert await repo.read_model_endpoint_response(model_endpoint_id=endpoint_id, owner="team") == (
+        None,
+        generation + 1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_write_after_invalidation_is_dropped(fake_redis):
+    aioredis.client.Redis.from_url = Mock(return_value=fake_redis)
+    repo = RedisModelEndpointResponseCacheRepository(redis_info="redis://test")
+    endpoint_id = "my_endpoint_id"
+    _, generation = await repo.read_model_endpoint_response(
+        model_endpoint_id=endpoint_id, owner="team"
+    )
+
+    # The endpoint is updated while the response read before the update is being rendered.
+    await repo.invalidate_model_endpoint(model_endpoint_id=endpoint_id)
+    await repo.write_model_endpoint_response(
+        model_endpoint_id=endpoint_id,
+        owner="team",
+        response=b'{"id": "stale"}',
+        ttl_seconds=30,
+        generation=generation,
+    )
+
+    response, _ = await repo.read_model_endpoint_response(
+        model_endpoint_id=endpoint_id, owner="team"
+    )
+    assert response is None
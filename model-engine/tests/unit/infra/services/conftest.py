@@ -13,6 +13,7 @@ def fake_live_model_endpoint_service(
     fake_model_endpoint_infra_gateway,
     fake_model_bundle_repository,
     fake_model_endpoint_cache_repository,
+    fake_model_endpoint_response_cache_repository,
     fake_async_model_endpoint_inference_gateway,
     fake_streaming_model_endpoint_inference_gateway,
     fake_sync_model_endpoint_inference_gateway,
@@ -40,6 +41,7 @@ def fake_live_model_endpoint_service(
         sync_model_endpoint_inference_gateway=fake_sync_model_endpoint_inference_gateway,
         inference_autoscaling_metrics_gateway=fake_inference_autoscaling_metrics_gateway,
         model_endpoints_schema_gateway=model_endpoints_schema_gateway,
+        model_endpoint_response_cache_repository=fake_model_endpoint_response_cache_repository,
     )
     return service
 
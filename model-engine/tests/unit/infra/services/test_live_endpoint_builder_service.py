@@ -38,6 +38,7 @@ def endpoint_builder_service_empty_docker_built(
     fake_filesystem_gateway,
     fake_notification_gateway,
     fake_feature_flag_repository,
+    fake_model_endpoint_response_cache_repository,
 ) -> LiveEndpointBuilderService:
     return LiveEndpointBuilderService(
         docker_repository=fake_docker_repository_image_always_exists,
@@ -48,6 +49,7 @@ def endpoint_builder_service_empty_docker_built(
         filesystem_gateway=fake_filesystem_gateway,
         notification_gateway=fake_notification_gateway,
         feature_flag_repo=fake_feature_flag_repository,
+        model_endpoint_response_cache_repository=fake_model_endpoint_response_cache_repository,
     )
 
 
@@ -159,6 +161,34 @@ async def test_build_endpoint(
                     assert sum(fake_monitoring_metrics_gateway.image_build_cache_miss.values()) > 0
 
 
+@pytest.mark.asyncio
+async def test_build_endpoint_invalidates_cached_responses(
+    build_endpoint_request_sync_pytorch: BuildEndpointRequest,
+    endpoint_builder_service_empty_docker_built: LiveEndpointBuilderService,
+    fake_model_endpoint_response_cache_repository: Any,
+):
+    service = endpoint_builder_service_empty_docker_built
+    request = build_endpoint_request_sync_pytorch
+    model_endpoint_id = request.model_endpoint_record.id
+    repo: Any = service.model_endpoint_record_repository
+    repo.add_model_endpoint_record(request.model_endpoint_record)
+    await fake_model_endpoint_response_cache_repository.write_model_endpoint_response(
+        model_endpoint_id=model_endpoint_id,
+        owner="test_owner",
+        response=b'{"status": "UPDATE_PENDING"}',
+        ttl_seconds=30,
+        generation=0,
+    )
+
+    response = await service.build_endpoint(request.copy(deep=True))
+
+    assert response == BuildEndpointResponse(status=BuildEndpointStatus.OK)
+    body, _ = await fake_model_endpoint_response_cache_repository.read_model_endpoint_response(
+        model_endpoint_id=model_endpoint_id, owner="test_owner"
+    )
+    assert body is None
+
+
 @pytest.mark.asyncio
 async def test_build_endpoint_update_failed_raises_resource_manager_exception(
     build_endpoint_request_sync_pytorch: BuildEndpointRequest,
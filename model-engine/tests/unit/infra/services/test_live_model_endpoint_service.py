@@ -116,6 +116,33 @@ async def test_create_get_model_endpoint_success(
     assert model_endpoint.dict() == model_endpoint_1.dict()
 
 
+@pytest.mark.asyncio
+async def test_list_model_endpoints_matches_get_model_endpoint(
+    model_endpoint_1: ModelEndpoint,
+    fake_live_model_endpoint_service: LiveModelEndpointService,
+):
+    model_endpoint_record = await _create_model_endpoint_helper(
+        model_endpoint=model_endpoint_1, service=fake_live_model_endpoint_service
+    )
+    model_endpoint_infra_gateway: Any = (
+        fake_live_model_endpoint_service.model_endpoint_infra_gateway
+    )
+    await model_endpoint_infra_gateway.promote_in_flight_infra(
+        owner=model_endpoint_record.created_by,
+        model_endpoint_name=model_endpoint_record.name,
+    )
+
+    # The first listing misses the cache and populates it, the second one reads from it.
+    for _ in range(2):
+        model_endpoints = await fake_live_model_endpoint_service.list_model_endpoints(
+            owner=model_endpoint_record.owner, name=None, order_by=None
+        )
+        assert len(model_endpoints) == 1
+        assert model_endpoints[0] == await fake_live_model_endpoint_service.get_model_endpoint(
+            model_endpoint_record.id
+        )
+
+
 @pytest.mark.asyncio
 async def test_create_model_endpoint_raises_already_exists(
     fake_live_model_endpoint_service: LiveModelEndpointService,
@@ -359,6 +386,49 @@ async def test_create_delete_model_endpoint_success(
     assert deleted_model_endpoint_record is None
 
 
+@pytest.mark.asyncio
+async def test_update_delete_model_endpoint_invalidates_cached_responses(
+    fake_live_model_endpoint_service: LiveModelEndpointService,
+    model_endpoint_1: ModelEndpoint,
+):
+    model_endpoint_record = await _create_model_endpoint_helper(
+        model_endpoint=model_endpoint_1, service=fake_live_model_endpoint_service
+    )
+    model_endpoint_infra_gateway: Any = (
+        fake_live_model_endpoint_service.model_endpoint_infra_gateway
+    )
+    await model_endpoint_infra_gateway.promote_in_flight_infra(
+        owner=model_endpoint_record.created_by,
+        model_endpoint_name=model_endpoint_record.name,
+    )
+    response_cache: Any = fake_live_model_endpoint_service.model_endpoint_response_cache_repository
+
+    async def cache_response():
+        _, generation = await response_cache.read_model_endpoint_response(
+            model_endpoint_id=model_endpoint_record.id, owner=model_endpoint_record.owner
+        )
+        await response_cache.write_model_endpoint_response(
+            model_endpoint_id=model_endpoint_record.id,
+            owner=model_endpoint_record.owner,
+            response=b"{}",
+            ttl_seconds=30,
+            generation=generation,
+        )
+        assert model_endpoint_record.id in response_cache.db
+
+    await cache_response()
+    await fake_live_model_endpoint_service.update_model_endpoint(
+        model_endpoint_id=model_endpoint_record.id, cpus=4
+    )
+    assert model_endpoint_record.id not in response_cache.db
+
+    await cache_response()
+    await fake_live_model_endpoint_service.delete_model_endpoint(
+        model_endpoint_id=model_endpoint_record.id
+    )
+    assert model_endpoint_record.id not in response_cache.db
+
+
 @pytest.mark.asyncio
 async def test_create_delete_model_endpoint_infra_not_deleted_raises_endpoint_delete_failed_exception(
     fake_live_model_endpoint_service: LiveModelEndpointService,